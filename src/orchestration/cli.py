@@ -2,28 +2,41 @@
 
 import errno
 import json
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import Annotated, TypeVar
+from typing import TYPE_CHECKING, Annotated, TypeVar
 
 import typer
-from filelock import Timeout
-from rich.console import Console
-from rich.table import Table
 
-from ynab_io.parser import YnabParser
-from ynab_io.safety import BackupManager, LockManager
+# ynab_io.parser (pydantic models), ynab_io.safety (filelock) and rich are imported inside the
+# functions that use them, so `--help` and argument errors don't pay for loading them
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+    from ynab_io.models import Transaction
+    from ynab_io.parser import YnabParser
 
 # Constants
 DEFAULT_ITEM_LIMIT = 3
 
 
-def _create_console() -> Console:
+def _create_console() -> "Console":
     """Create a Rich console instance for table output."""
+    from rich.console import Console
+
     return Console()
 
 
+def _create_table() -> "Table":
+    """Create a Rich table with the CLI's header style."""
+    from rich.table import Table
+
+    return Table(show_header=True, header_style="bold magenta")
+
+
 # Error message templates
 ERROR_LOCK_TIMEOUT = "Unable to acquire budget lock: Another application may be using this budget"
 ERROR_PERMISSION_DENIED = "Permission denied accessing budget files"
@@ -36,6 +49,12 @@ ERROR_DELTA_PROCESSING = "Error processing budget changes"
 ERROR_BACKUP_PERMISSION = "Unable to create backup: insufficient permissions"
 ERROR_BACKUP_DISK_SPACE = "Unable to create backup: insufficient disk space"
 
+# Message prefixes used by ynab_io when raising budget errors
+INVALID_STRUCTURE_PREFIX = "Invalid YNAB4 budget structure"
+CORRUPTED_DATA_PREFIX = "Corrupted YNAB4 budget data"
+INVALID_DELTA_FILENAME_PREFIX = "Invalid delta filename format"
+MISSING_BUDGET_PATH_PREFIX = "Budget path does not exist"
+
 
 # Type variable for generic functions
 T = TypeVar("T")
@@ -56,13 +75,14 @@ app.add_typer(transactions_app, name="transactions")
 
 
 @contextmanager
-def locked_budget_operation(budget_path: str) -> Generator[Path, None, None]:
+def locked_budget_operation(budget_path: str, shared: bool = False) -> Generator[Path, None, None]:
     """
     Context manager that validates budget path and acquires lock for safe operations.
     Used by budget show, accounts list, transactions list, and backup commands.
 
     Args:
         budget_path: String path to budget directory
+        shared: Acquire a shared lock so concurrent read-only commands do not block each other
 
     Yields:
         Path: Validated Path object
@@ -70,13 +90,14 @@ def locked_budget_operation(budget_path: str) -> Generator[Path, None, None]:
     Raises:
         typer.Exit: If path doesn't exist or lock cannot be acquired
     """
-    path = Path(budget_path)
-    if not path.exists():
-        typer.echo("Error: Budget path does not exist", err=True)
-        raise typer.Exit(1)
+    from filelock import Timeout
 
+    from ynab_io.safety import LockManager
+
+    path = Path(budget_path)
     try:
-        with LockManager(path):
+        # LockManager validates the path itself, so no separate existence check is needed here
+        with LockManager(path, shared=shared):
             yield path
     except Timeout:
         typer.echo(ERROR_LOCK_TIMEOUT, err=True)
@@ -84,6 +105,12 @@ def locked_budget_operation(budget_path: str) -> Generator[Path, None, None]:
     except PermissionError:
         typer.echo(ERROR_PERMISSION_DENIED, err=True)
         raise typer.Exit(1)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        if str(e).startswith(MISSING_BUDGET_PATH_PREFIX):
+            typer.echo("Error: Budget path does not exist", err=True)
+        else:
+            typer.echo(f"System error accessing budget: {e}", err=True)
+        raise typer.Exit(1)
     except OSError as e:
         if e.errno == errno.ENOSPC:
             typer.echo(ERROR_INSUFFICIENT_DISK_SPACE, err=True)
@@ -98,26 +125,6 @@ def locked_budget_operation(budget_path: str) -> Generator[Path, None, None]:
         raise typer.Exit(1)
 
 
-def validate_budget_path(budget_path: str) -> Path:
-    """
-    Validate that the budget path exists and return Path object.
-
-    Args:
-        budget_path: String path to budget directory
-
-    Returns:
-        Path object if valid
-
-    Raises:
-        typer.Exit: If path doesn't exist (exits with code 1)
-    """
-    path = Path(budget_path)
-    if not path.exists():
-        typer.echo("Error: Budget path does not exist", err=True)
-        raise typer.Exit(1)
-    return path
-
-
 def _handle_value_error_in_lock_operation(error: ValueError) -> None:
     """
     Handle ValueError exceptions in locked_budget_operation context manager.
@@ -150,57 +157,95 @@ def _extract_error_detail(error_msg: str, delimiter: str = ": ") -> str:
     return error_msg
 
 
-def handle_budget_error(operation: str, error: Exception) -> None:
-    """
-    Handle budget operation errors with consistent messaging.
+def _handle_json_decode_error(operation: str, error: Exception) -> None:
+    """Report JSON parsing errors in budget files."""
+    typer.echo(ERROR_JSON_INVALID, err=True)
 
-    Args:
-        operation: Description of the operation that failed
-        error: The exception that was raised
-    """
+
+def _handle_file_not_found_error(operation: str, error: Exception) -> None:
+    """Report missing budget paths and invalid YNAB4 directory structures."""
     error_msg = str(error)
+    if error_msg.startswith(INVALID_STRUCTURE_PREFIX):
+        detail = _extract_error_detail(error_msg)
+        typer.echo(f"{INVALID_STRUCTURE_PREFIX}: {detail}", err=True)
+    else:
+        typer.echo("Error: Budget path does not exist", err=True)
 
-    # Handle JSON parsing errors (must be before ValueError since JSONDecodeError inherits from ValueError)
-    if isinstance(error, json.JSONDecodeError):
-        typer.echo(ERROR_JSON_INVALID, err=True)
 
-    # Handle FileNotFoundError
-    elif isinstance(error, FileNotFoundError):
-        if "Invalid YNAB4 budget structure" in error_msg:
-            detail = _extract_error_detail(error_msg)
-            typer.echo(f"Invalid YNAB4 budget structure: {detail}", err=True)
-        else:
-            typer.echo("Error: Budget path does not exist", err=True)
+def _handle_value_error(operation: str, error: Exception) -> None:
+    """Report corrupted data, invalid structure, and delta parsing errors."""
+    error_msg = str(error)
+    if error_msg.startswith(CORRUPTED_DATA_PREFIX):
+        detail = _extract_error_detail(error_msg)
+        typer.echo(f"{ERROR_BUDGET_CORRUPTED}: {detail}", err=True)
+    elif error_msg.startswith(INVALID_DELTA_FILENAME_PREFIX):
+        delta_file = _extract_error_detail(error_msg)
+        typer.echo(f"{ERROR_DELTA_PROCESSING}: {delta_file}", err=True)
+    else:
+        _handle_generic_error(operation, error)
 
-    # Handle ValueError (corrupted data, invalid structure, delta parsing errors)
-    elif isinstance(error, ValueError):
-        if "Corrupted YNAB4 budget data" in error_msg:
-            detail = _extract_error_detail(error_msg)
-            typer.echo(f"{ERROR_BUDGET_CORRUPTED}: {detail}", err=True)
-        elif "Invalid delta filename format" in error_msg:
-            delta_file = _extract_error_detail(error_msg)
-            typer.echo(f"{ERROR_DELTA_PROCESSING}: {delta_file}", err=True)
-        else:
-            typer.echo(f"Error {operation}: {error}", err=True)
 
-    # Handle permission errors for backup operations
-    elif isinstance(error, PermissionError):
-        if "backup" in operation:
-            typer.echo(ERROR_BACKUP_PERMISSION, err=True)
-        else:
-            typer.echo(f"Error {operation}: {error}", err=True)
+def _handle_permission_error(operation: str, error: Exception) -> None:
+    """Report permission errors, with a dedicated message for backup operations."""
+    if "backup" in operation:
+        typer.echo(ERROR_BACKUP_PERMISSION, err=True)
+    else:
+        _handle_generic_error(operation, error)
 
-    # Handle disk space errors
-    elif isinstance(error, OSError) and getattr(error, "errno", None) == errno.ENOSPC:
-        if "backup" in operation:
-            typer.echo(ERROR_BACKUP_DISK_SPACE, err=True)
-        else:
-            typer.echo(f"Error {operation}: {error}", err=True)
 
-    # Generic fallback
+def _handle_os_error(operation: str, error: Exception) -> None:
+    """Report disk space errors, with a dedicated message for backup operations."""
+    if getattr(error, "errno", None) == errno.ENOSPC and "backup" in operation:
+        typer.echo(ERROR_BACKUP_DISK_SPACE, err=True)
     else:
-        typer.echo(f"Error {operation}: {error}", err=True)
+        _handle_generic_error(operation, error)
+
+
+def _handle_generic_error(operation: str, error: Exception) -> None:
+    """Report any error without a more specific handler."""
+    typer.echo(f"Error {operation}: {error}", err=True)
+
+
+# Error handlers keyed by exception type; subclasses resolve through their MRO,
+# so JSONDecodeError is matched before its ValueError base
+_ERROR_HANDLERS: dict[type[BaseException], Callable[[str, Exception], None]] = {
+    json.JSONDecodeError: _handle_json_decode_error,
+    FileNotFoundError: _handle_file_not_found_error,
+    ValueError: _handle_value_error,
+    PermissionError: _handle_permission_error,
+    OSError: _handle_os_error,
+}
+
+
+def _find_error_handler(error: Exception) -> Callable[[str, Exception], None]:
+    """
+    Find the handler registered for the most specific type of the error.
+
+    Args:
+        error: The exception that was raised
+
+    Returns:
+        Handler function for the error, or the generic handler if none is registered
+    """
+    handler = _ERROR_HANDLERS.get(type(error))
+    if handler is not None:
+        return handler
+    for error_type in type(error).__mro__[1:]:
+        handler = _ERROR_HANDLERS.get(error_type)
+        if handler is not None:
+            return handler
+    return _handle_generic_error
+
+
+def handle_budget_error(operation: str, error: Exception) -> None:
+    """
+    Handle budget operation errors with consistent messaging.
 
+    Args:
+        operation: Description of the operation that failed
+        error: The exception that was raised
+    """
+    _find_error_handler(error)(operation, error)
     raise typer.Exit(1)
 
 
@@ -214,10 +259,29 @@ def format_currency(amount: float) -> str:
     Returns:
         Formatted currency string
     """
-    return f"${amount:.2f}"
+    # printf-style formatting takes CPython's direct float formatting path, faster than f-string format specs
+    return "$%.2f" % amount  # noqa: UP031
 
 
-def display_accounts(parser: YnabParser, limit: int = DEFAULT_ITEM_LIMIT) -> None:
+def get_transaction_display_fields(parser: "YnabParser", transaction: "Transaction") -> tuple[str, str]:
+    """
+    Get the payee name and formatted amount shown for a transaction.
+
+    Args:
+        parser: YnabParser object the transaction belongs to
+        transaction: Transaction to display
+
+    Returns:
+        Tuple of (payee_name, formatted_amount)
+    """
+    try:
+        payee_name = parser.payees[transaction.payeeId].name
+    except KeyError:
+        payee_name = "Unknown Payee"
+    return payee_name, format_currency(transaction.amount)
+
+
+def display_accounts(parser: "YnabParser", limit: int = DEFAULT_ITEM_LIMIT) -> None:
     """
     Display account details with name, balance, and type.
 
@@ -225,13 +289,14 @@ def display_accounts(parser: YnabParser, limit: int = DEFAULT_ITEM_LIMIT) -> Non
         parser: YnabParser object containing accounts
         limit: Maximum number of accounts to display
     """
-    typer.echo("Account Details:")
-    for account in list(parser.accounts.values())[:limit]:
-        typer.echo(f"  - {account.accountName}")
-        typer.echo(f"    Type: {account.accountType}")
+    # Build the whole block and echo it once instead of issuing a write per line
+    lines = ["Account Details:"]
+    for account in islice(parser.accounts.values(), limit):
+        lines.append(f"  - {account.accountName}\n    Type: {account.accountType}")
+    typer.echo("\n".join(lines))
 
 
-def display_transactions(parser: YnabParser, limit: int = DEFAULT_ITEM_LIMIT) -> None:
+def display_transactions(parser: "YnabParser", limit: int = DEFAULT_ITEM_LIMIT) -> None:
     """
     Display transaction details with memo, amount, and date.
 
@@ -239,16 +304,14 @@ def display_transactions(parser: YnabParser, limit: int = DEFAULT_ITEM_LIMIT) ->
         parser: YnabParser object containing transactions
         limit: Maximum number of transactions to display
     """
-    typer.echo("Transaction Details:")
-    for transaction in list(parser.transactions.values())[:limit]:
-        payee = parser.payees.get(transaction.payeeId)
-        payee_name = payee.name if payee else "Unknown Payee"
-        typer.echo(f"  - {payee_name}")
-        typer.echo(f"    Amount: {format_currency(transaction.amount)}")
-        typer.echo(f"    Date: {transaction.date}")
+    lines = ["Transaction Details:"]
+    for transaction in islice(parser.transactions.values(), limit):
+        payee_name, amount = get_transaction_display_fields(parser, transaction)
+        lines.append(f"  - {payee_name}\n    Amount: {amount}\n    Date: {transaction.date}")
+    typer.echo("\n".join(lines))
 
 
-def display_accounts_table(parser: YnabParser, limit: int = DEFAULT_ITEM_LIMIT) -> None:
+def display_accounts_table(parser: "YnabParser", limit: int = DEFAULT_ITEM_LIMIT) -> None:
     """
     Display account details in a formatted table.
 
@@ -257,17 +320,17 @@ def display_accounts_table(parser: YnabParser, limit: int = DEFAULT_ITEM_LIMIT)
         limit: Maximum number of accounts to display
     """
     console = _create_console()
-    table = Table(show_header=True, header_style="bold magenta")
+    table = _create_table()
     table.add_column("Account Name")
     table.add_column("Account Type")
 
-    for account in list(parser.accounts.values())[:limit]:
+    for account in islice(parser.accounts.values(), limit):
         table.add_row(account.accountName, account.accountType)
 
     console.print(table)
 
 
-def display_transactions_table(parser: YnabParser, limit: int = DEFAULT_ITEM_LIMIT) -> None:
+def display_transactions_table(parser: "YnabParser", limit: int = DEFAULT_ITEM_LIMIT) -> None:
     """
     Display transaction details in a formatted table.
 
@@ -276,15 +339,14 @@ def display_transactions_table(parser: YnabParser, limit: int = DEFAULT_ITEM_LIM
         limit: Maximum number of transactions to display
     """
     console = _create_console()
-    table = Table(show_header=True, header_style="bold magenta")
+    table = _create_table()
     table.add_column("Payee")
     table.add_column("Amount")
     table.add_column("Date")
 
-    for transaction in list(parser.transactions.values())[:limit]:
-        payee = parser.payees.get(transaction.payeeId)
-        payee_name = payee.name if payee else "Unknown Payee"
-        table.add_row(payee_name, format_currency(transaction.amount), str(transaction.date))
+    for transaction in islice(parser.transactions.values(), limit):
+        payee_name, amount = get_transaction_display_fields(parser, transaction)
+        table.add_row(payee_name, amount, str(transaction.date))
 
     console.print(table)
 
@@ -298,11 +360,12 @@ def budget_show(
 
     Usage: [command] budget show --budget-path /path/to/budget.ynab4 --format table
     """
+    from ynab_io.parser import YnabParser
+
     try:
-        with locked_budget_operation(budget_path) as path:
+        with locked_budget_operation(budget_path, shared=True) as path:
             parser = YnabParser(path)
-            parser.parse()
-            parser.apply_deltas()
+            parser.load()
 
             # Display basic info
             typer.echo("Budget loaded successfully")
@@ -328,6 +391,8 @@ def backup(
 
     Usage: [command] backup --budget-path /path/to/budget.ynab4
     """
+    from ynab_io.safety import BackupManager
+
     try:
         with locked_budget_operation(budget_path) as path:
             # Create backup
@@ -350,11 +415,12 @@ def accounts_list(
 
     Usage: [command] accounts list --budget-path /path/to/budget.ynab4 --format table
     """
+    from ynab_io.parser import YnabParser
+
     try:
-        with locked_budget_operation(budget_path) as path:
+        with locked_budget_operation(budget_path, shared=True) as path:
             parser = YnabParser(path)
-            parser.parse()
-            parser.apply_deltas()
+            parser.load()
 
             # Display accounts
             if output_format == "table":
@@ -375,11 +441,12 @@ def transactions_list(
 
     Usage: [command] transactions list --budget-path /path/to/budget.ynab4 --format table
     """
+    from ynab_io.parser import YnabParser
+
     try:
-        with locked_budget_operation(budget_path) as path:
+        with locked_budget_operation(budget_path, shared=True) as path:
             parser = YnabParser(path)
-            parser.parse()
-            parser.apply_deltas()
+            parser.load()
 
             # Display transactions
             if output_format == "table":
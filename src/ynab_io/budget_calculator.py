@@ -1,21 +1,59 @@
+import re
+from collections import defaultdict
 from collections.abc import Generator
 from datetime import date
+from typing import NamedTuple
 
-from ynab_io.models import Budget, MonthlyBudget, MonthlyCategoryBudget
+import numpy as np
+
+from ynab_io.models import Budget, MonthlyBudget, MonthlyCategoryBudget, get_mutation_version
+
+# Integer codes for transaction cleared states; 0 means not cleared
+CLEARED_STATUS_CODES = {"Cleared": 1, "Reconciled": 2}
+
+# Accepted month arguments: YYYY-MM, optionally followed by a day as in YNAB4 month dates
+MONTH_PATTERN = re.compile(r"\d{4}-\d{2}(-\d{2})?")
+
+
+class _TransactionArrays(NamedTuple):
+    """Column-oriented (SoA) view of the budget transactions used for vectorized reductions."""
+
+    account_indices: dict[str, np.ndarray]
+    amounts: np.ndarray
+    cleared_codes: np.ndarray
+    dates: np.ndarray
+
+
+class _BudgetIndexes(NamedTuple):
+    """Hash-map lookups over monthly budgets and categories used by the monthly summary."""
+
+    monthly_budgets_by_month: dict[str, MonthlyBudget]
+    category_budgets_by_parent: dict[str, list[MonthlyCategoryBudget]]
+    category_names: dict[str, str]
 
 
 class BudgetCalculator:
     def __init__(self, budget: Budget):
         self.budget = budget
+        # Resolved once so repeated balance queries share the same cut-off date
+        self._today = date.today().isoformat()
+        self._transaction_arrays: _TransactionArrays | None = None
+        self._category_outflows: dict[tuple[str, str | None], float] | None = None
+        self._budget_indexes: _BudgetIndexes | None = None
+        self._balance_cache: dict[str, tuple[float, float]] = {}
+        self._summary_cache: dict[str, dict[str, dict[str, float]]] = {}
+        self._budget_version: tuple[int, ...] | None = None
 
     def get_account_balance(self, account_id: str) -> tuple[float, float]:
         """
         Calculate the account balance as (cleared_balance, uncleared_balance).
 
-        This method excludes transactions from the current date (today) to ensure
+        This method excludes transactions from the current date (today, as of calculator creation) to ensure
         balance calculations are stable and don't include pending same-day transactions
         that may still be processing.
 
+        Results are cached until the budget lists or any budget entity are modified.
+
         Args:
             account_id: The unique identifier of the account
 
@@ -24,65 +62,163 @@ class BudgetCalculator:
             - cleared_balance: Sum of all Cleared/Reconciled transactions (excluding today)
             - uncleared_balance: Sum of all other transactions (excluding today)
         """
-        cleared_balance = 0.0
-        uncleared_balance = 0.0
-        current_date = date.today().strftime("%Y-%m-%d")
-
-        for transaction in self.budget.transactions:
-            # Skip same-day transactions to avoid including pending/processing transactions
-            if transaction.accountId == account_id and transaction.date != current_date:
-                if transaction.cleared in ["Cleared", "Reconciled"]:
-                    cleared_balance += transaction.amount
-                else:
-                    uncleared_balance += transaction.amount
+        self._invalidate_if_budget_changed()
+        cached = self._balance_cache.get(account_id)
+        if cached is None:
+            cached = self._calculate_account_balance(account_id)
+            self._balance_cache[account_id] = cached
+        return cached
+
+    def _calculate_account_balance(self, account_id: str) -> tuple[float, float]:
+        """Calculate (cleared_balance, uncleared_balance) for an account from the transaction arrays."""
+        arrays = self._get_transaction_arrays()
+        indices = arrays.account_indices.get(account_id)
+        if indices is None:
+            return 0.0, 0.0
+
+        amounts = arrays.amounts[indices]
+        # Skip same-day transactions to avoid including pending/processing transactions
+        mask = arrays.dates[indices] != self._today
+        is_cleared = arrays.cleared_codes[indices] > 0
+        cleared_balance = float(amounts[mask & is_cleared].sum())
+        uncleared_balance = float(amounts[mask & ~is_cleared].sum())
 
         return cleared_balance, uncleared_balance
 
+    def _clear_caches(self) -> None:
+        """Drop all cached results and derived views so the next query recomputes them from the budget."""
+        self._transaction_arrays = None
+        self._category_outflows = None
+        self._budget_indexes = None
+        self._balance_cache.clear()
+        self._summary_cache.clear()
+
+    def _get_budget_version(self) -> tuple[int, ...]:
+        """Get a mutation version of the budget lists this calculator reads.
+
+        Field assignments on any budget model bump get_mutation_version(); hashing the item identities
+        catches entities added, removed or replaced within the lists.
+        """
+        budget = self.budget
+        return (
+            get_mutation_version(),
+            hash(tuple(map(id, budget.transactions))),
+            hash(tuple(map(id, budget.monthly_budgets))),
+            hash(tuple(map(id, budget.monthly_category_budgets))),
+            hash(tuple(map(id, budget.categories))),
+        )
+
+    def _invalidate_if_budget_changed(self) -> None:
+        """Drop cached results and derived views when the budget version changed since they were built."""
+        version = self._get_budget_version()
+        if version != self._budget_version:
+            self._budget_version = version
+            self._clear_caches()
+
+    def _get_transaction_arrays(self) -> _TransactionArrays:
+        """Get the column arrays for all transactions, building them on first use."""
+        if self._transaction_arrays is None:
+            transactions = self.budget.transactions
+            count = len(transactions)
+            indices_by_account: defaultdict[str, list[int]] = defaultdict(list)
+            for index, transaction in enumerate(transactions):
+                indices_by_account[transaction.accountId].append(index)
+
+            self._transaction_arrays = _TransactionArrays(
+                account_indices={
+                    account_id: np.array(indices, dtype=np.intp) for account_id, indices in indices_by_account.items()
+                },
+                amounts=np.fromiter((t.amount for t in transactions), dtype=np.float64, count=count),
+                cleared_codes=np.fromiter(
+                    (CLEARED_STATUS_CODES.get(t.cleared, 0) for t in transactions), dtype=np.int8, count=count
+                ),
+                dates=np.array([t.date for t in transactions], dtype=np.str_),
+            )
+        return self._transaction_arrays
+
+    def _get_category_outflows(self) -> dict[tuple[str, str | None], float]:
+        """Get total outflow per (YYYY-MM month, category ID), grouped in a single pass over transactions."""
+        if self._category_outflows is None:
+            outflows: defaultdict[tuple[str, str | None], float] = defaultdict(float)
+            for txn in self.budget.transactions:
+                if txn.amount < 0:
+                    outflows[(txn.date[:7], txn.categoryId)] -= txn.amount
+            self._category_outflows = dict(outflows)
+        return self._category_outflows
+
     def get_monthly_budget_summary(self, month: str) -> dict[str, dict[str, float]]:
         """
         Calculate the monthly budget summary showing budgeted amounts and outflows for each category.
 
+        Results are cached until the budget lists or any budget entity are modified.
+
         Args:
-            month: Month in YYYY-MM format (e.g., "2025-08")
+            month: Month in YYYY-MM format (e.g., "2025-08"); a full YYYY-MM-DD date selects its month
 
         Returns:
             Dictionary with category names as keys, each containing:
             - "budgeted": budgeted amount for the category
             - "outflow": total outflow (negative transactions) for the category
+
+        Raises:
+            ValueError: If month is not in YYYY-MM or YYYY-MM-DD format
         """
+        if not MONTH_PATTERN.fullmatch(month):
+            raise ValueError(f"Invalid month '{month}': expected YYYY-MM format")
+        # Cached views are keyed by YYYY-MM, so drop any day part
+        month = month[:7]
+        self._invalidate_if_budget_changed()
+        summary = self._summary_cache.get(month)
+        if summary is None:
+            summary = self._calculate_monthly_budget_summary(month)
+            self._summary_cache[month] = summary
+        # Hand out copies so callers cannot mutate the cached summary
+        return {category_name: dict(amounts) for category_name, amounts in summary.items()}
+
+    def _calculate_monthly_budget_summary(self, month: str) -> dict[str, dict[str, float]]:
+        """Calculate the monthly budget summary using the grouped outflows and dict indexes."""
         monthly_budget = self._find_monthly_budget(month)
         if not monthly_budget:
             return {}
 
+        outflows = self._get_category_outflows()
+        category_names = self._get_budget_indexes().category_names
         result = {}
         for mcb in self._get_category_budgets_for_month(monthly_budget.entityId):
-            category_name = self._get_category_name(mcb.categoryId)
+            # Budgeted categories almost always exist, so subscript on the fast path instead of dict.get
+            try:
+                category_name = category_names[mcb.categoryId]
+            except KeyError:
+                continue
             if category_name:
-                outflow = self._calculate_category_outflow(month, mcb.categoryId)
+                outflow = outflows.get((month, mcb.categoryId), 0.0)
                 result[category_name] = {"budgeted": mcb.budgeted, "outflow": outflow}
 
         return result
 
+    def _get_budget_indexes(self) -> _BudgetIndexes:
+        """Get dict indexes over monthly budgets and categories, building them on first use."""
+        if self._budget_indexes is None:
+            monthly_budgets_by_month: dict[str, MonthlyBudget] = {}
+            for mb in self.budget.monthly_budgets:
+                monthly_budgets_by_month.setdefault(mb.month[:7], mb)
+
+            category_budgets_by_parent: defaultdict[str, list[MonthlyCategoryBudget]] = defaultdict(list)
+            for mcb in self.budget.monthly_category_budgets:
+                category_budgets_by_parent[mcb.parentMonthlyBudgetId].append(mcb)
+
+            self._budget_indexes = _BudgetIndexes(
+                monthly_budgets_by_month=monthly_budgets_by_month,
+                category_budgets_by_parent=dict(category_budgets_by_parent),
+                category_names={cat.entityId: cat.name for cat in self.budget.categories},
+            )
+        return self._budget_indexes
+
     def _find_monthly_budget(self, month: str) -> MonthlyBudget | None:
         """Find the monthly budget for the given month."""
-        return next((mb for mb in self.budget.monthly_budgets if mb.month.startswith(month)), None)
+        return self._get_budget_indexes().monthly_budgets_by_month.get(month)
 
     def _get_category_budgets_for_month(self, monthly_budget_id: str) -> Generator[MonthlyCategoryBudget, None, None]:
         """Get category budgets for a specific month that have positive budgeted amounts."""
-        return (
-            mcb
-            for mcb in self.budget.monthly_category_budgets
-            if mcb.parentMonthlyBudgetId == monthly_budget_id and mcb.budgeted > 0
-        )
-
-    def _get_category_name(self, category_id: str) -> str | None:
-        """Get the name of a category by its ID."""
-        return next((cat.name for cat in self.budget.categories if cat.entityId == category_id), None)
-
-    def _calculate_category_outflow(self, month: str, category_id: str) -> float:
-        """Calculate outflow for a category based on negative transactions in the specified month."""
-        return sum(
-            abs(txn.amount)
-            for txn in self.budget.transactions
-            if (txn.date.startswith(month) and txn.amount < 0 and txn.categoryId == category_id)
-        )
+        category_budgets = self._get_budget_indexes().category_budgets_by_parent.get(monthly_budget_id, [])
+        return (mcb for mcb in category_budgets if mcb.budgeted > 0)
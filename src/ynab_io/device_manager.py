@@ -7,20 +7,86 @@ This module handles:
 - Device short ID assignment (A, B, C, etc.)
 """
 
-import json
-import re
+import functools
+import os
+import stat
+import tempfile
+import time
 import uuid
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 # Constants for YNAB4 device management
 DEFAULT_YNAB_VERSION = "Desktop version: YNAB 4 v4.3.857"
 DEFAULT_DEVICE_TYPE = "Desktop (Test)"
 DEFAULT_FORMAT_VERSION = "1.2"
 DEFAULT_DATA_VERSION = "4.2"
-VERSION_PATTERN = re.compile(r"^([A-Z])-(\d+)$")
 MAX_DEVICE_COUNT = 26  # A-Z
+VERSION_CACHE_SIZE = 4096
+
+
+def _read_json_file(path: str | Path) -> Any:
+    """Read and parse a JSON file with a single bytes read (orjson parses UTF-8 bytes directly)."""
+    return orjson.loads(Path(path).read_bytes())
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as 2-space indented JSON bytes."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def _write_json_file(path: Path, data: Any) -> None:
+    """Serialize data as 2-space indented JSON and write it in one call."""
+    path.write_bytes(_dump_json(data))
+
+
+# Version parsing is a pure function of the string, independent of any DeviceManager state, so the
+# parsed results are memoized module-wide and shared by all instances. Failures are not cached.
+@functools.lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_version_cached(version_str: str) -> tuple[str, int]:
+    """Parse a single 'A-86' version string into (device_id, version_number)."""
+    # Plain string checks instead of a regex: one uppercase ASCII letter, a dash, then ASCII digits
+    device_id, separator, version_num = version_str.partition("-")
+    if (
+        not separator
+        or len(device_id) != 1
+        or not "A" <= device_id <= "Z"
+        or not version_num.isascii()
+        or not version_num.isdigit()
+    ):
+        raise ValueError(f"Invalid version format: {version_str}")
+
+    return device_id, int(version_num)
+
+
+@functools.lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_composite_cached(composite_str: str) -> tuple[tuple[str, int], ...]:
+    """Parse a single or composite knowledge string into an immutable tuple of (device_id, version_number)."""
+    composite_str = composite_str.strip()
+    if not composite_str:
+        raise ValueError("Knowledge string cannot be empty")
+
+    if "," not in composite_str:
+        # Single version string
+        return (_parse_version_cached(composite_str),)
+
+    # Split by comma and parse each version in one pass, stripping every part once
+    parsed_versions = []
+    for raw_part in composite_str.split(","):
+        version_part = raw_part.strip()
+        if not version_part:
+            continue
+        try:
+            parsed_versions.append(_parse_version_cached(version_part))
+        except ValueError as e:
+            raise ValueError(f"Invalid version part '{version_part}' in composite string: {e}")
+
+    if not parsed_versions:
+        raise ValueError("No valid version parts found in composite knowledge string")
+
+    return tuple(parsed_versions)
 
 
 class DeviceManager:
@@ -36,20 +102,76 @@ class DeviceManager:
         self.budget_dir = budget_dir
         self.create_backups = create_backups
 
+    @property
+    def budget_dir(self) -> Path | None:
+        """Path to the YNAB4 budget directory."""
+        return self._budget_dir
+
+    @budget_dir.setter
+    def budget_dir(self, budget_dir: Path | None) -> None:
+        self._budget_dir = budget_dir
+        # Resolved directories and loaded devices belong to the previous budget
+        self._data_dir_cache: Path | None = None
+        self._devices_dir_cache: Path | None = None
+        self._devices_cache: dict[str, dict[str, Any]] | None = None
+
     def _get_data_dir(self) -> Path:
+        if self._data_dir_cache is None:
+            self._data_dir_cache = self._find_data_dir()
+        return self._data_dir_cache
+
+    def _find_data_dir(self) -> Path:
         if not self.budget_dir:
             raise ValueError("Budget directory not set")
-        for p in self.budget_dir.iterdir():
-            if p.is_dir() and p.name.startswith("data1~"):
-                return p
+        # os.scandir exposes the entry type from the directory listing, avoiding a stat() per entry
+        with os.scandir(self.budget_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("data1~") and entry.is_dir():
+                    return Path(entry.path)
         raise FileNotFoundError("Could not find data directory in budget")
 
     def _get_devices_dir(self) -> Path:
-        data_dir = self._get_data_dir()
-        devices_dir = data_dir / "devices"
-        if not devices_dir.exists():
-            raise FileNotFoundError("Could not find devices directory")
-        return devices_dir
+        if self._devices_dir_cache is None:
+            devices_dir = self._get_data_dir() / "devices"
+            if not devices_dir.exists():
+                raise FileNotFoundError("Could not find devices directory")
+            self._devices_dir_cache = devices_dir
+        return self._devices_dir_cache
+
+    def _scan_ydevice_files(self, devices_dir: Path) -> list[os.DirEntry]:
+        """List .ydevice files in the devices directory in a single os.scandir pass.
+
+        Args:
+            devices_dir: Path to the devices directory
+
+        Returns:
+            Directory entries of the .ydevice files
+        """
+        with os.scandir(devices_dir) as entries:
+            return [entry for entry in entries if entry.name.endswith(".ydevice") and entry.is_file()]
+
+    def _load_all_devices(self) -> dict[str, dict[str, Any]]:
+        """Load every readable .ydevice file once and reuse the result until it is invalidated.
+
+        Corrupted or unreadable files are skipped. The returned dicts are shared and must not be mutated.
+
+        Returns:
+            Dictionary mapping short device IDs to their parsed .ydevice data, in directory order
+        """
+        if self._devices_cache is None:
+            devices = {}
+            for entry in self._scan_ydevice_files(self._get_devices_dir()):
+                try:
+                    devices[entry.name.removesuffix(".ydevice")] = _read_json_file(entry.path)
+                except (OSError, orjson.JSONDecodeError):
+                    # Skip corrupted device files
+                    continue
+            self._devices_cache = devices
+        return self._devices_cache
+
+    def _invalidate_devices_cache(self) -> None:
+        """Forget loaded .ydevice data after this manager changes a device file."""
+        self._devices_cache = None
 
     def _get_ydevice_file_path(self, short_id: str) -> Path:
         devices_dir = self._get_devices_dir()
@@ -70,9 +192,15 @@ class DeviceManager:
         return self._get_ydevice_file_path(short_id)
 
     def get_device_guid(self, short_id: str) -> str:
-        ydevice_path = self._get_ydevice_file_path(short_id)
-        with open(ydevice_path, "r") as f:
-            device_data = json.load(f)
+        ydevice_path = self._get_devices_dir() / f"{short_id}.ydevice"
+        # Loaded devices come from a directory scan that already saw the file, so no existence check is needed
+        device_data = self._load_all_devices().get(short_id)
+        if device_data is None:
+            # Not loaded in bulk (missing or corrupted): read it directly so the underlying error surfaces
+            try:
+                device_data = _read_json_file(ydevice_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Could not find .ydevice file for short_id {short_id}")
         device_guid = device_data.get("deviceGUID")
         if not device_guid:
             raise ValueError(f"deviceGUID not found in {ydevice_path}")
@@ -97,23 +225,14 @@ class DeviceManager:
         Returns:
             Dictionary mapping device GUIDs to their knowledge versions
         """
-        devices_dir = self._get_devices_dir()
         device_knowledges = {}
 
-        for p in devices_dir.iterdir():
-            if p.is_file() and p.suffix == ".ydevice":
-                try:
-                    with open(p, "r") as f:
-                        device_data = json.load(f)
+        for device_data in self._load_all_devices().values():
+            device_guid = device_data.get("deviceGUID")
+            knowledge = device_data.get("knowledge")
 
-                    device_guid = device_data.get("deviceGUID")
-                    knowledge = device_data.get("knowledge")
-
-                    if device_guid and knowledge:
-                        device_knowledges[device_guid] = knowledge
-                except (OSError, json.JSONDecodeError):
-                    # Skip corrupted device files
-                    continue
+            if device_guid and knowledge:
+                device_knowledges[device_guid] = knowledge
 
         return device_knowledges
 
@@ -126,16 +245,25 @@ class DeviceManager:
         Returns:
             Device GUID with the latest knowledge
         """
-        latest_knowledge = self.get_latest_version(list(device_knowledges.values()))
-
-        # Compare the latest version from each knowledge string with the overall latest
+        # Track the owning GUID while scanning, so the latest version is found in one pass; on ties the
+        # first device in iteration order wins
+        latest: tuple[int, str] | None = None
+        latest_device_guid = next(iter(device_knowledges))
         for device_guid, knowledge in device_knowledges.items():
-            knowledge_latest = self.get_latest_version_from_composite(knowledge)
-            if knowledge_latest == latest_knowledge:
-                return device_guid
+            try:
+                if not isinstance(knowledge, str):
+                    raise ValueError(f"Knowledge string must be a string, got {type(knowledge)}")
+                parsed_versions = _parse_composite_cached(knowledge)
+            except ValueError as e:
+                raise ValueError(f"Invalid version string '{knowledge}': {e}")
 
-        # This should never happen given the input, but fallback for safety
-        return next(iter(device_knowledges.keys()))
+            for device_id, version_num in parsed_versions:
+                candidate = (version_num, device_id)
+                if latest is None or candidate > latest:
+                    latest = candidate
+                    latest_device_guid = device_guid
+
+        return latest_device_guid
 
     def _get_fallback_device_guid(self) -> str:
         """Get fallback device GUID when no valid knowledge versions found.
@@ -146,11 +274,8 @@ class DeviceManager:
         Raises:
             FileNotFoundError: If no .ydevice files found
         """
-        devices_dir = self._get_devices_dir()
-
-        for p in devices_dir.iterdir():
-            if p.is_file() and p.suffix == ".ydevice":
-                return self.get_device_guid(p.stem)
+        for short_id in self._load_all_devices():
+            return self.get_device_guid(short_id)
 
         raise FileNotFoundError("Could not find any .ydevice file")
 
@@ -241,18 +366,18 @@ class DeviceManager:
         if not device_guid or not isinstance(device_guid, str):
             raise ValueError("device_guid must be a non-empty string")
 
-        if not short_id or not isinstance(short_id, str) or len(short_id) != 1:
-            raise ValueError("short_id must be a single character")
+        if not (isinstance(short_id, str) and len(short_id) == 1 and "A" <= short_id <= "Z"):
+            raise ValueError("short_id must be a single character (A-Z)")
 
         if not friendly_name or not isinstance(friendly_name, str):
             raise ValueError("friendly_name must be a non-empty string")
 
-        # Validate knowledge format
+        # Validate knowledge format; a knowledge_in_full equal to knowledge needs no second check
         self.parse_version_string(knowledge)  # Will raise if invalid
 
         if knowledge_in_full is None:
             knowledge_in_full = knowledge
-        else:
+        elif knowledge_in_full != knowledge:
             self.parse_version_string(knowledge_in_full)  # Validate format
 
         return {
@@ -281,15 +406,18 @@ class DeviceManager:
         Raises:
             ValueError: If all device IDs (A-Z) are taken
         """
-        if len(existing_ids) >= MAX_DEVICE_COUNT:
+        # Bit i set means chr(ord("A") + i) is taken; IDs outside A-Z never block an assignment
+        taken_mask = 0
+        for short_id in existing_ids:
+            if len(short_id) == 1 and "A" <= short_id <= "Z":
+                taken_mask |= 1 << (ord(short_id) - ord("A"))
+
+        free_mask = ~taken_mask & ((1 << MAX_DEVICE_COUNT) - 1)
+        if not free_mask:
             raise ValueError(f"Maximum device count ({MAX_DEVICE_COUNT}) exceeded")
 
-        for i in range(MAX_DEVICE_COUNT):
-            short_id = chr(ord("A") + i)
-            if short_id not in existing_ids:
-                return short_id
-
-        raise ValueError("No available device IDs (A-Z all taken)")
+        # free_mask & -free_mask isolates the lowest free bit, i.e. the first available letter
+        return chr(ord("A") + (free_mask & -free_mask).bit_length() - 1)
 
     def register_new_device(
         self,
@@ -307,23 +435,19 @@ class DeviceManager:
         Returns:
             Dictionary with device information (deviceGUID, shortDeviceId)
         """
+        # _get_devices_dir raises if the directory is missing, so it always exists here
         devices_dir = self._get_devices_dir()
-        if not devices_dir.exists():
-            devices_dir.mkdir(parents=True)
 
-        # Find existing devices
-        existing_ids = []
-        for ydevice_file in devices_dir.glob("*.ydevice"):
-            device_id = ydevice_file.stem
-            existing_ids.append(device_id)
+        # Find existing devices. This is the one fresh listing kept on this path: loaded devices skip corrupted
+        # files and may predate another application's registration, and reusing a taken ID would overwrite it
+        existing_ids = [entry.name.removesuffix(".ydevice") for entry in self._scan_ydevice_files(devices_dir)]
 
         # Generate new device info
         device_guid = self.generate_device_guid()
         short_id = self.assign_next_short_id(existing_ids)
 
-        # Create device directory
-        data_dir = self._get_data_dir()
-        device_dir = data_dir / device_guid
+        # Create device directory (data_dir is memoized, so this does not walk the budget again)
+        device_dir = self._get_data_dir() / device_guid
         device_dir.mkdir(exist_ok=True)
 
         # Create .ydevice file
@@ -337,8 +461,8 @@ class DeviceManager:
         )
 
         ydevice_path = devices_dir / f"{short_id}.ydevice"
-        with open(ydevice_path, "w") as f:
-            json.dump(ydevice_data, f, indent=2)
+        _write_json_file(ydevice_path, ydevice_data)
+        self._invalidate_devices_cache()
 
         return {"deviceGUID": device_guid, "shortDeviceId": short_id}
 
@@ -357,14 +481,7 @@ class DeviceManager:
         if not isinstance(version_str, str):
             raise ValueError(f"Version string must be a string, got {type(version_str)}")
 
-        match = VERSION_PATTERN.match(version_str)
-        if not match:
-            raise ValueError(f"Invalid version format: {version_str}")
-
-        device_id = match.group(1)
-        version_num = int(match.group(2))
-
-        return device_id, version_num
+        return _parse_version_cached(version_str)
 
     def increment_version(self, version_str: str) -> str:
         """Increment version number.
@@ -388,21 +505,11 @@ class DeviceManager:
         Returns:
             -1 if version1 < version2, 0 if equal, 1 if version1 > version2
         """
-        device1, num1 = self.parse_version_string(version1)
-        device2, num2 = self.parse_version_string(version2)
-
-        # Compare device IDs first, then version numbers
-        if device1 < device2:
-            return -1
-        elif device1 > device2:
-            return 1
-        else:
-            if num1 < num2:
-                return -1
-            elif num1 > num2:
-                return 1
-            else:
-                return 0
+        parsed1 = self.parse_version_string(version1)
+        parsed2 = self.parse_version_string(version2)
+
+        # (device_id, version_number) tuples compare device IDs first, then version numbers
+        return (parsed1 > parsed2) - (parsed1 < parsed2)
 
     def parse_composite_knowledge_string(self, composite_str: str) -> list[tuple[str, int]]:
         """Parse composite knowledge string like 'A-11429,B-63,C-52'.
@@ -430,29 +537,8 @@ class DeviceManager:
         if not isinstance(composite_str, str):
             raise ValueError(f"Knowledge string must be a string, got {type(composite_str)}")
 
-        composite_str = composite_str.strip()
-        if not composite_str:
-            raise ValueError("Knowledge string cannot be empty")
-
-        if "," not in composite_str:
-            # Single version string
-            device_id, version_num = self.parse_version_string(composite_str)
-            return [(device_id, version_num)]
-
-        # Split by comma and parse each version
-        version_parts = [part.strip() for part in composite_str.split(",") if part.strip()]
-        if not version_parts:
-            raise ValueError("No valid version parts found in composite knowledge string")
-
-        parsed_versions = []
-        for version_part in version_parts:
-            try:
-                device_id, version_num = self.parse_version_string(version_part)
-                parsed_versions.append((device_id, version_num))
-            except ValueError as e:
-                raise ValueError(f"Invalid version part '{version_part}' in composite string: {e}")
-
-        return parsed_versions
+        # Copy the shared cached tuple so callers get their own mutable list
+        return list(_parse_composite_cached(composite_str))
 
     def get_latest_version_from_composite(self, composite_str: str) -> str:
         """Get the latest version from a composite knowledge string.
@@ -474,7 +560,10 @@ class DeviceManager:
             >>> dm.get_latest_version_from_composite("A-11429,B-63,C-52")
             'A-11429'
         """
-        parsed_versions = self.parse_composite_knowledge_string(composite_str)
+        if not isinstance(composite_str, str):
+            raise ValueError(f"Knowledge string must be a string, got {type(composite_str)}")
+
+        parsed_versions = _parse_composite_cached(composite_str)
 
         # Find the version with the highest version number, then by device ID
         latest_version = max(parsed_versions, key=lambda x: (x[1], x[0]))
@@ -505,21 +594,22 @@ class DeviceManager:
         if not versions:
             raise ValueError("Version list cannot be empty")
 
-        # Extract the latest version from each knowledge string
-        all_latest_versions = []
+        # Single pass over every (device_id, version_number) pair, keeping the highest (number, device ID)
+        latest: tuple[int, str] | None = None
         for version_str in versions:
             try:
-                latest_from_this_str = self.get_latest_version_from_composite(version_str)
-                all_latest_versions.append(latest_from_this_str)
+                if not isinstance(version_str, str):
+                    raise ValueError(f"Knowledge string must be a string, got {type(version_str)}")
+                parsed_versions = _parse_composite_cached(version_str)
             except ValueError as e:
                 raise ValueError(f"Invalid version string '{version_str}': {e}")
 
-        # Find the overall latest version using consistent sorting logic
-        def version_sort_key(version_str: str):
-            device_id, version_num = self.parse_version_string(version_str)
-            return (version_num, device_id)
+            for device_id, version_num in parsed_versions:
+                candidate = (version_num, device_id)
+                if latest is None or candidate > latest:
+                    latest = candidate
 
-        return max(all_latest_versions, key=version_sort_key)
+        return f"{latest[1]}-{latest[0]}"
 
     def get_global_knowledge(self) -> str | None:
         """Calculate global knowledge from all .ydevice files.
@@ -527,22 +617,15 @@ class DeviceManager:
         Returns:
             Latest knowledge version string or None if no devices found
         """
+        # Always reload: another application such as YNAB may have rewritten a device file since the last call,
+        # and file timestamps are too coarse to tell reliably
+        self._invalidate_devices_cache()
         try:
-            devices_dir = self._get_devices_dir()
+            devices = self._load_all_devices()
         except FileNotFoundError:
             return None
 
-        all_knowledges = []
-        for ydevice_file in devices_dir.glob("*.ydevice"):
-            try:
-                with open(ydevice_file, "r") as f:
-                    ydevice_data = json.load(f)
-
-                if "knowledge" in ydevice_data:
-                    all_knowledges.append(ydevice_data["knowledge"])
-            except (OSError, json.JSONDecodeError):
-                # Ignore corrupted or unreadable files
-                continue
+        all_knowledges = [ydevice_data["knowledge"] for ydevice_data in devices.values() if "knowledge" in ydevice_data]
 
         if not all_knowledges:
             return None
@@ -565,30 +648,43 @@ class DeviceManager:
         if new_full_budget_knowledge is None:
             new_full_budget_knowledge = new_knowledge
 
+        # Read the current file once; the bytes serve both the backup fallback and the update
+        raw_device_data = ydevice_path.read_bytes()
+
         # Create backup if requested
         if self.create_backups:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Nanosecond epoch suffix: cheaper than strftime and unique even for several updates per second
+            timestamp = time.time_ns()
             backup_path = ydevice_path.with_suffix(f".ydevice.backup_{timestamp}")
-            backup_path.write_bytes(ydevice_path.read_bytes())
+            try:
+                # A hard link shares the original inode without copying data; the atomic replace below
+                # gives ydevice_path a new inode, so the backup keeps the pre-update content
+                os.link(ydevice_path, backup_path)
+            except OSError:
+                # No hard link support (or the backup name is already taken): copy instead
+                backup_path.write_bytes(raw_device_data)
 
-        # Read current data
-        with open(ydevice_path, "r") as f:
-            device_data = json.load(f)
+        device_data = orjson.loads(raw_device_data)
 
         # Update knowledge fields
         device_data["knowledge"] = new_knowledge
         device_data["knowledgeInFullBudgetFile"] = new_full_budget_knowledge
 
-        # Write atomically by using temporary file
-        temp_path = ydevice_path.with_suffix(".ydevice.tmp")
+        # Write atomically through a uniquely named temporary file, so concurrent updaters never share it.
+        # The name doesn't end in .ydevice, so device scans never pick it up.
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{ydevice_path.stem}_", suffix=".ydevice.tmp", dir=ydevice_path.parent
+        )
         try:
-            with open(temp_path, "w") as f:
-                json.dump(device_data, f, indent=2)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dump_json(device_data))
+            # mkstemp creates the file as 0600; keep the permissions of the file being replaced
+            os.chmod(temp_path, stat.S_IMODE(os.stat(ydevice_path).st_mode))
 
             # Atomic rename
-            temp_path.replace(ydevice_path)
-        except Exception:
-            # Clean up temp file if it exists
-            if temp_path.exists():
-                temp_path.unlink()
+            os.replace(temp_path, ydevice_path)
+        except BaseException:
+            # mkstemp guarantees the temp file exists until the rename, so no existence check is needed
+            os.unlink(temp_path)
             raise
+        self._invalidate_devices_cache()
@@ -1,9 +1,28 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict
 
 
-class Account(BaseModel):
+class _TrackedModel(BaseModel):
+    """Base model that bumps a shared mutation version on every field assignment."""
+
+    mutation_version: ClassVar[int] = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        _TrackedModel.mutation_version += 1
+
+
+def get_mutation_version() -> int:
+    """Get a counter that changes whenever a field of any budget model is assigned.
+
+    Caches derived from budget entities compare this counter to detect in-place edits such as
+    ``transaction.amount = ...`` or ``budget.transactions = [...]``.
+    """
+    return _TrackedModel.mutation_version
+
+
+class Account(_TrackedModel):
     model_config = ConfigDict(extra="ignore")
     entityId: str
     accountName: str
@@ -14,7 +33,7 @@ class Account(BaseModel):
     entityVersion: str
 
 
-class Payee(BaseModel):
+class Payee(_TrackedModel):
     model_config = ConfigDict(extra="ignore")
     entityId: str
     name: str
@@ -22,7 +41,7 @@ class Payee(BaseModel):
     entityVersion: str
 
 
-class Transaction(BaseModel):
+class Transaction(_TrackedModel):
     model_config = ConfigDict(extra="ignore")
     entityId: str
     accountId: str
@@ -36,7 +55,7 @@ class Transaction(BaseModel):
     memo: str | None = None
 
 
-class MasterCategory(BaseModel):
+class MasterCategory(_TrackedModel):
     """Master category (category group) in YNAB4."""
 
     model_config = ConfigDict(extra="ignore")
@@ -49,7 +68,7 @@ class MasterCategory(BaseModel):
     entityVersion: str
 
 
-class Category(BaseModel):
+class Category(_TrackedModel):
     """Individual budget category within a master category."""
 
     model_config = ConfigDict(extra="ignore")
@@ -62,7 +81,7 @@ class Category(BaseModel):
     cachedBalance: Any | None = None
 
 
-class MonthlyBudget(BaseModel):
+class MonthlyBudget(_TrackedModel):
     """Monthly budget data for a specific month."""
 
     model_config = ConfigDict(extra="ignore")
@@ -72,7 +91,7 @@ class MonthlyBudget(BaseModel):
     monthlySubCategoryBudgets: list[Any] | None = None
 
 
-class MonthlyCategoryBudget(BaseModel):
+class MonthlyCategoryBudget(_TrackedModel):
     """Monthly category budget allocation within a specific month."""
 
     model_config = ConfigDict(extra="ignore")
@@ -85,7 +104,7 @@ class MonthlyCategoryBudget(BaseModel):
     note: str | None = None
 
 
-class ScheduledTransaction(BaseModel):
+class ScheduledTransaction(_TrackedModel):
     """Recurring/scheduled transaction in YNAB4."""
 
     model_config = ConfigDict(extra="ignore")
@@ -98,7 +117,7 @@ class ScheduledTransaction(BaseModel):
     date: str | None = None
 
 
-class PayeeStringCondition(BaseModel):
+class PayeeStringCondition(_TrackedModel):
     """String condition for payee matching in YNAB4."""
 
     model_config = ConfigDict(extra="ignore")
@@ -112,7 +131,14 @@ class PayeeStringCondition(BaseModel):
     isResolvedConflict: bool
 
 
-class Budget(BaseModel):
+class Budget(_TrackedModel):
+    """Snapshot of a parsed budget.
+
+    Every collection is a concrete list materialized once by YnabParser.parse(), so repeated
+    iteration never re-parses. The lists and entities stay mutable; BudgetCalculator detects
+    edits through get_mutation_version() and the identity of the list items.
+    """
+
     accounts: list[Account]
     payees: list[Payee]
     transactions: list[Transaction]
@@ -1,9 +1,16 @@
 import copy
-import json
+import functools
 import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import orjson
+from pydantic import TypeAdapter
+
 from .device_manager import DeviceManager
 from .models import (
     Account,
@@ -18,6 +25,26 @@ from .models import (
     Transaction,
 )
 
+# Delta files are read and decoded on worker threads a few files ahead of the (sequential) apply loop
+DELTA_LOAD_WORKERS = 4
+DELTA_PREFETCH_DEPTH = 8
+
+# Top-level Budget.yfull sections holding flat entity lists, mapped to the delta entityType they share a collection with
+YFULL_ENTITY_SECTIONS = {
+    "accounts": "account",
+    "payees": "payee",
+    "transactions": "transaction",
+    "monthlyBudgets": "monthlyBudget",
+    "monthlyCategoryBudgets": "monthlyCategoryBudget",
+    "scheduledTransactions": "scheduledTransaction",
+}
+
+
+@functools.cache
+def _get_list_adapter(model_class: type) -> TypeAdapter:
+    """Get a (memoized) TypeAdapter that validates a whole list of entities in one pydantic-core call."""
+    return TypeAdapter(list[model_class])
+
 
 class YnabParser:
     def __init__(self, budget_path: Path):
@@ -25,8 +52,10 @@ class YnabParser:
         try:
             self.device_manager = DeviceManager(budget_path)
             self.data_dir = self.device_manager.get_data_dir_path()
-            device_guid = self.device_manager.get_active_device_guid()
-            self.device_dir = self.device_manager.get_device_dir_path(device_guid)
+            # The active device is resolved once; parsing reuses its Budget.yfull path instead of re-scanning devices
+            self.device_guid = self.device_manager.get_active_device_guid()
+            self.budget_file_path = self.device_manager.get_budget_file_path(self.device_guid)
+            self.device_dir = self.budget_file_path.parent
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Invalid YNAB4 budget structure: {e}")
         except ValueError as e:
@@ -40,18 +69,32 @@ class YnabParser:
         self.monthly_category_budgets: dict[str, MonthlyCategoryBudget] = {}
         self.scheduled_transactions: dict[str, ScheduledTransaction] = {}
         self.payee_string_conditions: dict[str, PayeeStringCondition] = {}
+        self._entity_mappings = self._build_entity_mappings()
 
         # Version tracking state
         self.applied_deltas: list[Path] = []
         self._base_state: dict = {}
 
+        # Version numbers are pure functions of their strings, so they are parsed once per parser
+        self._version_number_cache: dict[str, int] = {}
+        self._delta_version_numbers_cache: dict[str, tuple[int, int]] = {}
+
     def parse(self) -> Budget:
         """Parse the budget and apply all available deltas.
 
         Returns:
             Budget object at the latest version state
         """
-        return self._parse_with_delta_strategy(lambda: self.apply_deltas())
+        self.load()
+        return self._create_budget_object()
+
+    def load(self) -> None:
+        """Parse the budget and apply all available deltas into the parser collections.
+
+        Unlike parse(), no Budget snapshot is built, so callers that only read the parser's
+        dictionaries skip copying every collection into lists.
+        """
+        self._parse_with_delta_strategy(lambda: self.apply_deltas())
 
     def parse_up_to_version(self, target_version: int) -> Budget:
         """Parse the budget and apply deltas only up to the specified version.
@@ -71,40 +114,30 @@ class YnabParser:
             if target_version > 0:
                 self._apply_deltas_up_to_version(target_version)
 
-        return self._parse_with_delta_strategy(delta_strategy)
+        self._parse_with_delta_strategy(delta_strategy)
+        return self._create_budget_object()
 
-    def _parse_with_delta_strategy(self, delta_strategy_func) -> Budget:
+    def _parse_with_delta_strategy(self, delta_strategy_func) -> None:
         """Parse base budget data and apply deltas using the provided strategy.
 
         Args:
             delta_strategy_func: Function that applies deltas according to specific strategy
-
-        Returns:
-            Budget object in the state after applying the delta strategy
         """
-        device_guid = self.device_manager.get_active_device_guid()
-        yfull_path = self.device_manager.get_budget_file_path(device_guid)
-        with open(yfull_path, "r") as f:
-            data = json.load(f)
-
-        # Parse simple entities
-        self._parse_entities(data.get("accounts", []), Account, self.accounts)
-        self._parse_entities(data.get("payees", []), Payee, self.payees)
-        self._parse_entities(data.get("transactions", []), Transaction, self.transactions)
-        self._parse_entities(data.get("monthlyBudgets", []), MonthlyBudget, self.monthly_budgets)
-        self._parse_entities(
-            data.get("monthlyCategoryBudgets", []),
-            MonthlyCategoryBudget,
-            self.monthly_category_budgets,
-        )
-        self._parse_entities(
-            data.get("scheduledTransactions", []),
-            ScheduledTransaction,
-            self.scheduled_transactions,
-        )
+        # orjson parses the raw bytes directly, skipping the text decode and the stdlib tokenizer. The file is read
+        # rather than memory-mapped: a concurrent truncation by YNAB4 or a sync client would turn into SIGBUS.
+        with open(self.budget_file_path, "rb") as f:
+            data = orjson.loads(f.read())
+
+        # Parse simple entities through the same dispatch table deltas use. Each raw section is popped as it is
+        # parsed so its dicts can be freed before the next section's models are built, instead of the whole raw
+        # document living until the end.
+        for section, entity_type in YFULL_ENTITY_SECTIONS.items():
+            collection, model_class = self._entity_mappings[entity_type]
+            self._parse_entities(data.pop(section, []), model_class, collection)
 
         # Parse master categories with nested categories
-        self._parse_master_categories(data.get("masterCategories", []))
+        self._parse_master_categories(data.pop("masterCategories", []))
+        del data
 
         # Save base state before applying deltas
         self._save_base_state()
@@ -112,15 +145,15 @@ class YnabParser:
         # Apply deltas using the provided strategy
         delta_strategy_func()
 
-        return self._create_budget_object()
-
     def _create_budget_object(self) -> Budget:
         """Create a Budget object from the current parser state.
 
         Returns:
             Budget object containing all parsed entities
         """
-        return Budget(
+        # Every entity was already validated when parsed (in bulk via TypeAdapter) or merged from a delta,
+        # so construct the Budget without re-walking the lists through validation
+        return Budget.model_construct(
             accounts=list(self.accounts.values()),
             payees=list(self.payees.values()),
             transactions=list(self.transactions.values()),
@@ -134,8 +167,7 @@ class YnabParser:
 
     def _parse_entities(self, entity_data_list, model_class, collection):
         """Parse a list of entities into the specified collection."""
-        for entity_data in entity_data_list:
-            entity = model_class(**entity_data)
+        for entity in _get_list_adapter(model_class).validate_python(entity_data_list):
             collection[entity.entityId] = entity
 
     def _parse_master_categories(self, master_categories_data):
@@ -143,9 +175,7 @@ class YnabParser:
         for master_category_data in master_categories_data:
             # Extract and process nested categories first
             if "subCategories" in master_category_data and master_category_data["subCategories"] is not None:
-                for category_data in master_category_data["subCategories"]:
-                    category = Category(**category_data)
-                    self.categories[category.entityId] = category
+                self._parse_entities(master_category_data["subCategories"], Category, self.categories)
 
             # Create master category without subCategories to avoid circular reference
             master_category_clean = {k: v for k, v in master_category_data.items() if k != "subCategories"}
@@ -154,7 +184,14 @@ class YnabParser:
 
     def _get_entity_mapping(self, entity_type):
         """Get the collection and model class for a given entity type."""
-        entity_mappings = {
+        return self._entity_mappings.get(entity_type, (None, None))
+
+    def _build_entity_mappings(self) -> dict[str, tuple[dict, type]]:
+        """Build the delta entityType dispatch table over the current collections.
+
+        Rebuilt whenever the collection dicts are rebound (see _restore_from_state) so it never points at stale dicts.
+        """
+        return {
             # Basic entities
             "account": (self.accounts, Account),
             "payee": (self.payees, Payee),
@@ -172,21 +209,60 @@ class YnabParser:
             # Scheduled transactions
             "scheduledTransaction": (self.scheduled_transactions, ScheduledTransaction),
         }
-        return entity_mappings.get(entity_type, (None, None))
 
     def apply_deltas(self):
-        delta_files = self._discover_delta_files()
-        for delta_file in delta_files:
-            self._apply_delta(delta_file)
-            self.applied_deltas.append(delta_file)
+        self._apply_delta_files(self._discover_delta_files())
+
+    def _apply_delta_files(self, delta_files: list[Path]):
+        """Apply delta files in order while the next ones are loaded in the background.
+
+        Deltas must be applied sequentially because later deltas build on earlier entity state, but reading
+        and decoding a file does not depend on that state, so it overlaps with applying the previous one.
+
+        Args:
+            delta_files: Delta files to apply, already sorted in version order
+        """
+        if not delta_files:
+            return
+
+        remaining_files = iter(delta_files)
+        with ThreadPoolExecutor(max_workers=DELTA_LOAD_WORKERS) as executor:
+            pending = deque(
+                (delta_file, executor.submit(self._load_delta, delta_file))
+                for delta_file in islice(remaining_files, DELTA_PREFETCH_DEPTH)
+            )
+            while pending:
+                delta_file, future = pending.popleft()
+                next_file = next(remaining_files, None)
+                if next_file is not None:
+                    pending.append((next_file, executor.submit(self._load_delta, next_file)))
+
+                self._apply_delta(delta_file, future.result())
+                self.applied_deltas.append(delta_file)
 
     def _discover_delta_files(self) -> list[Path]:
-        ydiff_files = list(self.device_dir.glob("*.ydiff"))
+        """Get the delta files in version order; sort keys come from the per-filename version cache."""
+        # scandir with a suffix check avoids glob's per-entry pattern matching
+        with os.scandir(self.device_dir) as entries:
+            ydiff_files = [Path(entry.path) for entry in entries if entry.name.endswith(".ydiff")]
         return sorted(ydiff_files, key=self._get_delta_sort_key)
 
     def _get_delta_sort_key(self, delta_path: Path) -> int:
-        start_version, _ = self._parse_delta_versions(delta_path.name)
-        return self._get_version_number_from_composite(start_version, f"delta file '{delta_path.name}'")
+        start_version_num, _ = self._get_delta_version_numbers(delta_path.name)
+        return start_version_num
+
+    def _get_delta_version_numbers(self, filename: str) -> tuple[int, int]:
+        """Get the (start, end) version numbers encoded in a delta filename, parsing each filename once."""
+        version_numbers = self._delta_version_numbers_cache.get(filename)
+        if version_numbers is None:
+            start_version, end_version = self._parse_delta_versions(filename)
+            context = f"delta file '{filename}'"
+            version_numbers = (
+                self._get_version_number_from_composite(start_version, context),
+                self._get_version_number_from_composite(end_version, context),
+            )
+            self._delta_version_numbers_cache[filename] = version_numbers
+        return version_numbers
 
     def _get_version_number_from_composite(self, composite_version: str, context: str) -> int:
         """Extract the version number from a composite version string using DeviceManager methods.
@@ -198,13 +274,19 @@ class YnabParser:
         Returns:
             The version number from the latest version in the composite string
         """
+        version_num = self._version_number_cache.get(composite_version)
+        if version_num is not None:
+            return version_num
+
         try:
             latest_version = self.device_manager.get_latest_version_from_composite(composite_version)
             _, version_num = self.device_manager.parse_version_string(latest_version)
-            return version_num
         except ValueError as e:
             raise ValueError(f"Failed to parse version number from '{composite_version}' in {context}: {e}")
 
+        self._version_number_cache[composite_version] = version_num
+        return version_num
+
     def _parse_delta_versions(self, filename: str) -> tuple[str, str]:
         if not filename.endswith(".ydiff"):
             raise ValueError(f"Invalid delta filename format: {filename}")
@@ -215,9 +297,14 @@ class YnabParser:
             raise ValueError(f"Invalid delta filename format: {filename}")
         return start_version, end_version
 
-    def _apply_delta(self, delta_file: Path):
-        with open(delta_file, "r") as f:
-            delta_data = json.load(f)
+    def _load_delta(self, delta_file: Path) -> dict[str, Any]:
+        """Read and decode a delta file."""
+        with open(delta_file, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _apply_delta(self, delta_file: Path, delta_data: dict[str, Any] | None = None):
+        if delta_data is None:
+            delta_data = self._load_delta(delta_file)
 
         for item in delta_data.get("items", []):
             entity_id = item["entityId"]
@@ -249,9 +336,9 @@ class YnabParser:
                 )
 
                 if new_version_num > existing_version_num:
-                    updated_data = existing_entity.model_dump()
-                    updated_data.update(item)
-                    collection[entity_id] = model(**updated_data)
+                    # Merge onto the already-validated field values instead of a model_dump() round-trip;
+                    # the merged dict is still validated so fields coming from the delta get coerced
+                    collection[entity_id] = model.model_validate({**existing_entity.__dict__, **item})
             else:
                 collection[entity_id] = model(**item)
 
@@ -262,6 +349,8 @@ class YnabParser:
     def restore_to_version(self, target_version: int):
         """Restore parser state to a specific version number.
 
+        The base state is always restored first, so in-place edits made to the current entities are discarded.
+
         Args:
             target_version: Version number to restore to (0 = base state)
 
@@ -283,8 +372,8 @@ class YnabParser:
 
     def _get_version_end_number(self, delta_path: Path) -> int:
         """Extract the end version number from a delta filename."""
-        _, end_version = self._parse_delta_versions(delta_path.name)
-        return self._get_version_number_from_composite(end_version, f"delta file '{delta_path.name}'")
+        _, end_version_num = self._get_delta_version_numbers(delta_path.name)
+        return end_version_num
 
     def get_available_versions(self) -> list[int]:
         """Get sorted list of available version numbers."""
@@ -330,6 +419,7 @@ class YnabParser:
         self.monthly_category_budgets = copy.deepcopy(state["monthly_category_budgets"])
         self.scheduled_transactions = copy.deepcopy(state["scheduled_transactions"])
         self.payee_string_conditions = copy.deepcopy(state["payee_string_conditions"])
+        self._entity_mappings = self._build_entity_mappings()
 
     def _validate_target_version(self, target_version: int):
         """Validate that target version is valid and available.
@@ -353,11 +443,12 @@ class YnabParser:
         Args:
             target_version: Version number to apply deltas up to
         """
-        delta_files = self._discover_delta_files()
-        for delta_file in delta_files:
+        # Select the files first so deltas past the target are never even read
+        delta_files = []
+        for delta_file in self._discover_delta_files():
             end_version = self._get_version_end_number(delta_file)
-            if end_version <= target_version:
-                self._apply_delta(delta_file)
-                self.applied_deltas.append(delta_file)
-            else:
+            if end_version > target_version:
                 break
+            delta_files.append(delta_file)
+
+        self._apply_delta_files(delta_files)
@@ -1,10 +1,49 @@
 """Backup and safety utilities for YNAB4 operations."""
 
+import errno
+import os
+import stat
+import time
 import zipfile
 from datetime import datetime
 from pathlib import Path
 
-from filelock import FileLock
+from filelock import FileLock, Timeout
+
+try:
+    import fcntl
+except ImportError:  # Windows: shared locks fall back to the exclusive FileLock
+    fcntl = None
+
+# Seconds between non-blocking attempts while waiting for a shared lock
+SHARED_LOCK_POLL_INTERVAL = 0.05
+
+
+def _validate_budget_directory(budget_path: Path) -> None:
+    """
+    Validate that a path is an existing YNAB4 budget directory.
+
+    Existence and directory checks share a single stat call.
+
+    Args:
+        budget_path: Path to the .ynab4 budget directory
+
+    Raises:
+        FileNotFoundError: If the budget path doesn't exist
+        ValueError: If the path is not a valid YNAB4 budget directory
+    """
+    try:
+        path_stat = budget_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        # A path below a regular file is just as missing as a nonexistent one
+        raise FileNotFoundError(f"Budget path does not exist: {budget_path}")
+
+    if not stat.S_ISDIR(path_stat.st_mode):
+        raise ValueError("Budget path must be a directory")
+
+    # Verify it's a YNAB4 budget directory (contains Budget.ymeta)
+    if not (budget_path / "Budget.ymeta").exists():
+        raise ValueError("Not a valid YNAB4 budget directory: missing Budget.ymeta")
 
 
 class BackupManager:
@@ -25,18 +64,7 @@ class BackupManager:
             ValueError: If the path is not a valid YNAB4 budget directory
         """
         budget_path = Path(budget_path)
-
-        # Verify the budget path exists
-        if not budget_path.exists():
-            raise FileNotFoundError(f"Budget path does not exist: {budget_path}")
-
-        # Verify it's a directory
-        if not budget_path.is_dir():
-            raise ValueError("Budget path must be a directory")
-
-        # Verify it's a YNAB4 budget directory (contains Budget.ymeta)
-        if not (budget_path / "Budget.ymeta").exists():
-            raise ValueError("Not a valid YNAB4 budget directory: missing Budget.ymeta")
+        _validate_budget_directory(budget_path)
 
         # Generate timestamp for backup filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -61,13 +89,18 @@ class BackupManager:
 class LockManager:
     """Manages file locking for YNAB4 budget operations to prevent concurrent access."""
 
-    def __init__(self, budget_path: str | Path, timeout: float = 10.0):
+    def __init__(self, budget_path: str | Path, timeout: float = 10.0, shared: bool = False):
         """
         Initialize the LockManager.
 
+        Shared locks let read-only operations run concurrently with each other while still excluding
+        holders of the exclusive lock. They take a flock(LOCK_SH) on the same lock file FileLock uses, so
+        both modes interoperate; where flock is unavailable the exclusive lock is used instead.
+
         Args:
             budget_path: Path to the .ynab4 budget directory
             timeout: Timeout in seconds for acquiring the lock
+            shared: Whether to acquire a shared (reader) lock instead of an exclusive one
 
         Raises:
             FileNotFoundError: If the budget path doesn't exist
@@ -75,35 +108,74 @@ class LockManager:
         """
         self.budget_path = Path(budget_path)
         self.timeout = timeout
-
-        # Verify the budget path exists
-        if not self.budget_path.exists():
-            raise FileNotFoundError(f"Budget path does not exist: {self.budget_path}")
-
-        # Verify it's a directory
-        if not self.budget_path.is_dir():
-            raise ValueError("Budget path must be a directory")
-
-        # Verify it's a YNAB4 budget directory (contains Budget.ymeta)
-        if not (self.budget_path / "Budget.ymeta").exists():
-            raise ValueError("Not a valid YNAB4 budget directory: missing Budget.ymeta")
+        _validate_budget_directory(self.budget_path)
 
         # Create lock file path within the .ynab4 directory
         self.lock_file_path = self.budget_path / "budget.lock"
         self.file_lock = FileLock(str(self.lock_file_path), timeout=self.timeout)
+        self.shared = shared and fcntl is not None
+        self._shared_lock_fd: int | None = None
 
     def __enter__(self):
         """Acquire the lock when entering the context manager."""
         try:
-            self.file_lock.acquire()
+            if self.shared:
+                self._acquire_shared_lock()
+            else:
+                self.file_lock.acquire()
             return self
+        except Timeout:
+            # Callers such as the CLI report lock timeouts separately from other failures
+            raise
         except Exception as e:
             raise Exception(f"Failed to acquire lock for budget: {e}")
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Release the lock when exiting the context manager."""
         try:
-            self.file_lock.release()
+            if self._shared_lock_fd is not None:
+                fd, self._shared_lock_fd = self._shared_lock_fd, None
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                finally:
+                    os.close(fd)
+            else:
+                self.file_lock.release()
         except Exception:
             # Ensure lock is always released even if an error occurs
             pass
+
+    def _acquire_shared_lock(self) -> None:
+        """
+        Take a shared flock on the lock file, polling until the timeout expires.
+
+        A negative timeout waits indefinitely, as with FileLock. On file systems without flock support
+        the exclusive FileLock is acquired instead.
+
+        Raises:
+            Timeout: If an exclusive holder keeps the lock past the timeout
+        """
+        # Never follow a symlink planted at the lock path
+        fd = os.open(self.lock_file_path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o644)
+        deadline = None if self.timeout < 0 else time.monotonic() + self.timeout
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        raise Timeout(str(self.lock_file_path))
+                    time.sleep(SHARED_LOCK_POLL_INTERVAL)
+        except OSError as e:
+            os.close(fd)
+            if e.errno != errno.ENOSYS:
+                raise
+            # No flock here (e.g. some network file systems); FileLock degrades to a soft lock file itself
+            self.shared = False
+            self.file_lock.acquire()
+            return
+        except BaseException:
+            os.close(fd)
+            raise
+        self._shared_lock_fd = fd
@@ -189,13 +189,109 @@ def test_get_monthly_budget_summary_outflow_calculation(calculator: BudgetCalcul
 
 
 def test_get_monthly_budget_summary_month_format(calculator: BudgetCalculator):
-    """Tests various month format inputs."""
-    # Should work with YYYY-MM format
-    summary1 = calculator.get_monthly_budget_summary("2025-08")
-    summary2 = calculator.get_monthly_budget_summary("2025-8")  # Single digit month
-
-    # Both should work (assuming the method handles format variations)
-    # For now, let's just test that they don't crash
-    assert isinstance(summary1, dict)
-    # This works correctly since the implementation handles both YYYY-MM-DD and YYYY-MM format
-    assert isinstance(summary2, dict)
+    """Tests that a full YYYY-MM-DD date selects the same month as YYYY-MM."""
+    summary = calculator.get_monthly_budget_summary("2025-08")
+
+    assert summary
+    assert calculator.get_monthly_budget_summary("2025-08-01") == summary
+
+
+@pytest.mark.parametrize("month", ["2025-8", "2025", "", "2025-08-1", "August 2025"])
+def test_get_monthly_budget_summary_rejects_malformed_month(calculator: BudgetCalculator, month: str):
+    """Tests that malformed months raise ValueError instead of returning an empty summary."""
+    with pytest.raises(ValueError, match="Invalid month"):
+        calculator.get_monthly_budget_summary(month)
+
+
+def test_get_account_balance_reflects_transactions_added_after_first_call(calculator: BudgetCalculator, budget: Budget):
+    """Tests that cached transaction arrays are rebuilt when transactions are appended to the budget."""
+    from ynab_io.models import Transaction
+
+    assert calculator.get_account_balance("late-account") == (0, 0)
+
+    budget.transactions.append(
+        Transaction(
+            entityId="late-1",
+            accountId="late-account",
+            amount=42.5,
+            date="2025-01-01",
+            cleared="Reconciled",
+            accepted=True,
+            entityVersion="A-1",
+        )
+    )
+
+    assert calculator.get_account_balance("late-account") == (42.5, 0)
+
+
+def test_get_account_balance_excludes_transactions_dated_today(calculator: BudgetCalculator, budget: Budget):
+    """Tests that transactions dated on the current day are left out of both balances."""
+    from datetime import date
+
+    from ynab_io.models import Transaction
+
+    budget.transactions.append(
+        Transaction(
+            entityId="today-1",
+            accountId="today-account",
+            amount=10.0,
+            date=date.today().isoformat(),
+            cleared="Cleared",
+            accepted=True,
+            entityVersion="A-1",
+        )
+    )
+    budget.transactions.append(
+        Transaction(
+            entityId="yesterday-1",
+            accountId="today-account",
+            amount=5.0,
+            date="2025-01-01",
+            cleared="Cleared",
+            accepted=True,
+            entityVersion="A-1",
+        )
+    )
+
+    assert calculator.get_account_balance("today-account") == (5.0, 0)
+
+
+def test_get_monthly_budget_summary_returns_independent_copies(calculator: BudgetCalculator):
+    """Tests that mutating a returned summary does not leak into later (cached) results."""
+    summary = calculator.get_monthly_budget_summary("2025-08")
+    category_name = next(iter(summary))
+    expected = dict(summary[category_name])
+
+    summary[category_name]["outflow"] = -1.0
+    summary.clear()
+
+    assert calculator.get_monthly_budget_summary("2025-08")[category_name] == expected
+
+
+def test_cached_results_reflect_in_place_edits(calculator: BudgetCalculator, budget: Budget):
+    """Tests that cached balances and summaries reflect entities edited or replaced in place."""
+    from ynab_io.models import Transaction
+
+    budget.transactions.append(
+        Transaction(
+            entityId="edit-1",
+            accountId="edit-account",
+            amount=10.0,
+            date="2025-01-01",
+            cleared="Cleared",
+            accepted=True,
+            entityVersion="A-1",
+        )
+    )
+    assert calculator.get_account_balance("edit-account") == (10.0, 0)
+
+    budget.transactions[-1].amount = 25.0
+    assert calculator.get_account_balance("edit-account") == (25.0, 0)
+
+    budget.transactions[-1] = budget.transactions[-1].model_copy(update={"cleared": "Uncleared"})
+    assert calculator.get_account_balance("edit-account") == (0, 25.0)
+
+    category_name, amounts = next(iter(calculator.get_monthly_budget_summary("2025-08").items()))
+    category = next(cat for cat in budget.categories if cat.name == category_name)
+    category.name = "Renamed Category"
+    assert calculator.get_monthly_budget_summary("2025-08")["Renamed Category"] == amounts
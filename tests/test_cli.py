@@ -1,11 +1,13 @@
 """Test cases for the YNAB CLI tool - reorganized per subcommand."""
 
 import errno
+import functools
 import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import typer
 from assertpy import assert_that
 from filelock import Timeout
 from typer.testing import CliRunner
@@ -63,7 +65,7 @@ class TestEnhancedErrorHandling:
 
     def test_locked_budget_operation_filelock_timeout_error(self, runner):
         """Test locked_budget_operation handles Timeout from filelock properly."""
-        with patch("orchestration.cli.LockManager") as mock_lock_manager:
+        with patch("ynab_io.safety.LockManager") as mock_lock_manager:
             mock_lock_manager.side_effect = Timeout("tests/fixtures/My Test Budget~E0C1460F.ynab4")
 
             result = runner.invoke(
@@ -73,9 +75,41 @@ class TestEnhancedErrorHandling:
             assert result.exit_code == 1
             assert "Unable to acquire budget lock: Another application may be using this budget" in result.stderr
 
+    def test_locked_budget_operation_shared_lock_times_out_behind_exclusive_holder(self, tmp_path, capsys):
+        """Test that a shared lock blocked by an exclusive holder reports the lock timeout."""
+        from orchestration.cli import ERROR_LOCK_TIMEOUT, locked_budget_operation
+        from ynab_io.safety import LockManager
+
+        budget_dir = tmp_path / "Test.ynab4"
+        budget_dir.mkdir()
+        (budget_dir / "Budget.ymeta").write_text("{}")
+
+        with (
+            LockManager(budget_dir),
+            patch("ynab_io.safety.LockManager", functools.partial(LockManager, timeout=0.1)),
+            pytest.raises(typer.Exit),
+        ):
+            with locked_budget_operation(str(budget_dir), shared=True):
+                pass
+
+        assert ERROR_LOCK_TIMEOUT in capsys.readouterr().err
+
+    def test_locked_budget_operation_reports_other_missing_files_as_system_errors(self, runner):
+        """Test that a missing file other than the budget path is not reported as a missing budget."""
+        with patch("ynab_io.safety.LockManager") as mock_lock_manager:
+            mock_lock_manager.side_effect = FileNotFoundError(errno.ENOENT, "No such file or directory", "budget.lock")
+
+            result = runner.invoke(
+                app, ["budget", "show", "--budget-path", "tests/fixtures/My Test Budget~E0C1460F.ynab4"]
+            )
+
+            assert result.exit_code == 1
+            assert "System error accessing budget" in result.stderr
+            assert "Budget path does not exist" not in result.stderr
+
     def test_locked_budget_operation_permission_denied_error(self, runner):
         """Test locked_budget_operation handles PermissionError properly."""
-        with patch("orchestration.cli.LockManager") as mock_lock_manager:
+        with patch("ynab_io.safety.LockManager") as mock_lock_manager:
             mock_lock_manager.side_effect = PermissionError("Permission denied")
 
             result = runner.invoke(
@@ -87,7 +121,7 @@ class TestEnhancedErrorHandling:
 
     def test_locked_budget_operation_disk_space_error(self, runner):
         """Test locked_budget_operation handles disk space errors properly."""
-        with patch("orchestration.cli.LockManager") as mock_lock_manager:
+        with patch("ynab_io.safety.LockManager") as mock_lock_manager:
             disk_error = OSError("No space left on device")
             disk_error.errno = errno.ENOSPC
             mock_lock_manager.side_effect = disk_error
@@ -102,7 +136,7 @@ class TestEnhancedErrorHandling:
     def test_handle_budget_error_corrupted_ynab_structure(self, runner):
         """Test handle_budget_error provides specific message for corrupted YNAB structure."""
         with patch("orchestration.cli.locked_budget_operation"):
-            with patch("orchestration.cli.YnabParser") as mock_parser:
+            with patch("ynab_io.parser.YnabParser") as mock_parser:
                 mock_parser.side_effect = ValueError("Corrupted YNAB4 budget data: Invalid transaction format")
 
                 result = runner.invoke(
@@ -115,7 +149,7 @@ class TestEnhancedErrorHandling:
     def test_handle_budget_error_invalid_ynab_structure(self, runner):
         """Test handle_budget_error provides specific message for invalid YNAB structure."""
         with patch("orchestration.cli.locked_budget_operation"):
-            with patch("orchestration.cli.YnabParser") as mock_parser:
+            with patch("ynab_io.parser.YnabParser") as mock_parser:
                 mock_parser.side_effect = FileNotFoundError(
                     "Invalid YNAB4 budget structure: Missing required Budget.yfull file"
                 )
@@ -130,7 +164,7 @@ class TestEnhancedErrorHandling:
     def test_handle_budget_error_json_parse_error(self, runner):
         """Test handle_budget_error provides specific message for JSON parsing errors."""
         with patch("orchestration.cli.locked_budget_operation"):
-            with patch("orchestration.cli.YnabParser") as mock_parser:
+            with patch("ynab_io.parser.YnabParser") as mock_parser:
                 mock_parser.side_effect = json.JSONDecodeError("Invalid JSON", "doc", 0)
 
                 result = runner.invoke(
@@ -143,7 +177,7 @@ class TestEnhancedErrorHandling:
     def test_handle_budget_error_backup_insufficient_permissions(self, runner):
         """Test handle_budget_error provides specific message for backup permission errors."""
         with patch("orchestration.cli.locked_budget_operation"):
-            with patch("orchestration.cli.BackupManager") as mock_backup:
+            with patch("ynab_io.safety.BackupManager") as mock_backup:
                 mock_backup.return_value.backup_budget.side_effect = PermissionError("Permission denied")
 
                 result = runner.invoke(app, ["backup", "--budget-path", "tests/fixtures/My Test Budget~E0C1460F.ynab4"])
@@ -154,7 +188,7 @@ class TestEnhancedErrorHandling:
     def test_handle_budget_error_backup_disk_space_error(self, runner):
         """Test handle_budget_error provides specific message for backup disk space errors."""
         with patch("orchestration.cli.locked_budget_operation"):
-            with patch("orchestration.cli.BackupManager") as mock_backup:
+            with patch("ynab_io.safety.BackupManager") as mock_backup:
                 disk_error = OSError("No space left on device")
                 disk_error.errno = errno.ENOSPC
                 mock_backup.return_value.backup_budget.side_effect = disk_error
@@ -167,10 +201,8 @@ class TestEnhancedErrorHandling:
     def test_handle_budget_error_parser_apply_deltas_error(self, runner):
         """Test handle_budget_error provides specific message for delta parsing errors."""
         with patch("orchestration.cli.locked_budget_operation"):
-            with patch("orchestration.cli.YnabParser") as mock_parser:
-                mock_parser.return_value.apply_deltas.side_effect = ValueError(
-                    "Invalid delta filename format: A-86_B-12.ydiff"
-                )
+            with patch("ynab_io.parser.YnabParser") as mock_parser:
+                mock_parser.return_value.load.side_effect = ValueError("Invalid delta filename format: A-86_B-12.ydiff")
 
                 result = runner.invoke(
                     app, ["budget", "show", "--budget-path", "tests/fixtures/My Test Budget~E0C1460F.ynab4"]
@@ -182,7 +214,7 @@ class TestEnhancedErrorHandling:
     def test_handle_budget_error_generic_fallback(self, runner):
         """Test handle_budget_error provides generic fallback for unrecognized errors."""
         with patch("orchestration.cli.locked_budget_operation"):
-            with patch("orchestration.cli.YnabParser") as mock_parser:
+            with patch("ynab_io.parser.YnabParser") as mock_parser:
                 mock_parser.side_effect = RuntimeError("Some unexpected error")
 
                 result = runner.invoke(
@@ -194,7 +226,7 @@ class TestEnhancedErrorHandling:
 
     def test_locked_budget_operation_budget_ymeta_missing(self, runner):
         """Test locked_budget_operation provides specific error when Budget.ymeta is missing."""
-        with patch("orchestration.cli.LockManager") as mock_lock_manager:
+        with patch("ynab_io.safety.LockManager") as mock_lock_manager:
             mock_lock_manager.side_effect = ValueError("Not a valid YNAB4 budget directory: missing Budget.ymeta")
 
             result = runner.invoke(
@@ -206,7 +238,7 @@ class TestEnhancedErrorHandling:
 
     def test_locked_budget_operation_not_directory_error(self, runner):
         """Test locked_budget_operation provides specific error when path is not a directory."""
-        with patch("orchestration.cli.LockManager") as mock_lock_manager:
+        with patch("ynab_io.safety.LockManager") as mock_lock_manager:
             mock_lock_manager.side_effect = ValueError("Budget path must be a directory")
 
             result = runner.invoke(
@@ -216,6 +248,23 @@ class TestEnhancedErrorHandling:
             assert result.exit_code == 1
             assert "Budget path must be a directory, not a file" in result.stderr
 
+    def test_handle_budget_error_resolves_exception_subclasses(self, runner):
+        """Test handle_budget_error picks the handler of the closest registered base class."""
+
+        class CustomDecodeError(json.JSONDecodeError):
+            pass
+
+        with patch("orchestration.cli.locked_budget_operation"):
+            with patch("ynab_io.parser.YnabParser") as mock_parser:
+                mock_parser.side_effect = CustomDecodeError("Invalid JSON", "doc", 0)
+
+                result = runner.invoke(
+                    app, ["budget", "show", "--budget-path", "tests/fixtures/My Test Budget~E0C1460F.ynab4"]
+                )
+
+                assert result.exit_code == 1
+                assert "Budget file contains invalid data format" in result.stderr
+
 
 class TestBudgetCommands:
     """Test cases for budget subcommands."""
@@ -274,6 +323,16 @@ class TestBudgetCommands:
         assert result.exit_code == 1
         assert "Error: Budget path does not exist" in result.stderr
 
+    def test_budget_show_path_below_regular_file(self, runner, tmp_path):
+        """Test budget show reports a path nested under a regular file as nonexistent."""
+        regular_file = tmp_path / "afile"
+        regular_file.write_text("")
+
+        result = runner.invoke(app, ["budget", "show", "--budget-path", str(regular_file / "sub")])
+
+        assert result.exit_code == 1
+        assert "Error: Budget path does not exist" in result.stderr
+
     @patch("orchestration.cli.locked_budget_operation")
     def test_budget_show_uses_lock_manager(self, mock_locked_operation, runner, test_budget_path):
         """Test budget show command uses locked_budget_operation context manager."""
@@ -284,7 +343,7 @@ class TestBudgetCommands:
         result = runner.invoke(app, ["budget", "show", "--budget-path", str(test_budget_path)])
 
         # Verify locked_budget_operation was called with correct path
-        mock_locked_operation.assert_called_once_with(str(test_budget_path))
+        mock_locked_operation.assert_called_once_with(str(test_budget_path), shared=True)
 
         # Verify context manager was used
         mock_context.__enter__.assert_called_once()
@@ -368,7 +427,7 @@ class TestAccountsCommands:
         result = runner.invoke(app, ["accounts", "list", "--budget-path", str(test_budget_path)])
 
         # Verify locked_budget_operation was called with correct path
-        mock_locked_operation.assert_called_once_with(str(test_budget_path))
+        mock_locked_operation.assert_called_once_with(str(test_budget_path), shared=True)
 
         # Verify context manager was used
         mock_context.__enter__.assert_called_once()
@@ -443,6 +502,20 @@ class TestTransactionsCommands:
         assert "┏" not in result.stdout
         assert "┃" not in result.stdout
 
+    def test_transaction_display_fields_reflect_in_place_edits(self, test_budget_path):
+        """Test payee/amount display fields follow entities edited in place."""
+        from orchestration.cli import get_transaction_display_fields
+        from ynab_io.parser import YnabParser
+
+        parser = YnabParser(test_budget_path)
+        parser.parse()
+        transaction = next(t for t in parser.transactions.values() if t.payeeId in parser.payees)
+        get_transaction_display_fields(parser, transaction)
+
+        transaction.amount = 12.5
+        parser.payees[transaction.payeeId].name = "Renamed Payee"
+        assert get_transaction_display_fields(parser, transaction) == ("Renamed Payee", "$12.50")
+
     def test_transactions_list_invalid_path(self, runner):
         """Test transactions list command with invalid budget path."""
         result = runner.invoke(app, ["transactions", "list", "--budget-path", "nonexistent/path"])
@@ -460,7 +533,7 @@ class TestTransactionsCommands:
         result = runner.invoke(app, ["transactions", "list", "--budget-path", str(test_budget_path)])
 
         # Verify locked_budget_operation was called with correct path
-        mock_locked_operation.assert_called_once_with(str(test_budget_path))
+        mock_locked_operation.assert_called_once_with(str(test_budget_path), shared=True)
 
         # Verify context manager was used
         mock_context.__enter__.assert_called_once()
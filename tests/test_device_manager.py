@@ -35,6 +35,11 @@ class TestDeviceManagerCompositeKnowledge:
         with pytest.raises(ValueError, match="Invalid version format"):
             self.device_manager.parse_version_string("-86")
 
+        # Lowercase or multi-letter device IDs and non-ASCII digits are rejected
+        for version in ("a-86", "AB-86", "A-8-6", "A-\u00b2"):
+            with pytest.raises(ValueError, match="Invalid version format"):
+                self.device_manager.parse_version_string(version)
+
     def test_parse_composite_knowledge_string_simple(self):
         """Test parsing composite knowledge strings like 'A-11429,B-63'."""
         composite_knowledge = "A-11429,B-63"
@@ -79,7 +84,9 @@ class TestDeviceManagerCompositeKnowledge:
         """Test get_global_knowledge when .ydevice files contain composite knowledge strings."""
         # Mock the directory structure and file contents
         mock_devices_dir = Mock()
-        mock_ydevice_files = [Mock(name="A.ydevice"), Mock(name="B.ydevice")]
+        mock_ydevice_files = [Mock(path="A.ydevice"), Mock(path="B.ydevice")]
+        for mock_file in mock_ydevice_files:
+            mock_file.name = mock_file.path
 
         # Mock file contents with composite knowledge
         mock_file_contents = [
@@ -89,11 +96,10 @@ class TestDeviceManagerCompositeKnowledge:
 
         with (
             patch.object(self.device_manager, "_get_devices_dir", return_value=mock_devices_dir),
-            patch.object(mock_devices_dir, "glob", return_value=mock_ydevice_files),
-            patch("builtins.open"),
-            patch("json.load") as mock_json_load,
+            patch.object(self.device_manager, "_scan_ydevice_files", return_value=mock_ydevice_files),
+            patch("ynab_io.device_manager._read_json_file") as mock_read_json,
         ):
-            mock_json_load.side_effect = mock_file_contents
+            mock_read_json.side_effect = mock_file_contents
 
             # Should now work and return the highest version from all knowledge strings
             result = self.device_manager.get_global_knowledge()
@@ -135,6 +141,13 @@ class TestDeviceManagerCompositeKnowledgeHelpers:
         expected = [("A", 11429), ("B", 63), ("C", 52), ("E", 232), ("F", 31)]
         assert result == expected
 
+    def test_parse_composite_knowledge_string_results_are_independent(self):
+        """Test that mutating a parsed result does not affect later (memoized) parses."""
+        result = self.device_manager.parse_composite_knowledge_string("A-11429,B-63")
+        result.append(("Z", 1))
+
+        assert self.device_manager.parse_composite_knowledge_string("A-11429,B-63") == [("A", 11429), ("B", 63)]
+
     def test_get_latest_version_from_composite_method(self):
         """Test getting latest version from composite knowledge string."""
         # Test single version string
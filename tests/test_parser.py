@@ -47,6 +47,15 @@ class TestYnabParser:
         assert parser.device_dir.exists()
         assert parser.device_dir.is_dir()
 
+    def test_parse_does_not_resolve_active_device_again(self, parser):
+        """Test that parsing reuses the device and Budget.yfull path resolved at initialization."""
+        assert parser.budget_file_path == parser.device_dir / "Budget.yfull"
+
+        with patch.object(parser.device_manager, "get_active_device_guid") as get_active_device_guid:
+            parser.parse()
+
+        get_active_device_guid.assert_not_called()
+
     def test_parser_initialization_creates_empty_collections(self, parser):
         """Test that parser initializes with empty collections."""
         assert parser.accounts == {}
@@ -254,6 +263,15 @@ class TestYnabParser:
         with pytest.raises(FileNotFoundError):
             parser.parse()
 
+    def test_parse_empty_budget_yfull_raises_json_error(self, parser, tmp_path):
+        """Test that an empty Budget.yfull is reported as invalid JSON."""
+        empty_yfull = tmp_path / "Budget.yfull"
+        empty_yfull.write_bytes(b"")
+        parser.budget_file_path = empty_yfull
+
+        with pytest.raises(json.JSONDecodeError):
+            parser.parse()
+
     def test_discover_delta_files_finds_all_ydiff_files(self, parser):
         """Test that _discover_delta_files finds all .ydiff files."""
         delta_files = parser._discover_delta_files()
@@ -285,6 +303,23 @@ class TestYnabParser:
             140 in version_numbers or 141 in version_numbers or max(version_numbers) >= 140
         )  # Should have high version numbers
 
+    def test_discover_delta_files_picks_up_new_delta_files(self, tmp_path, test_budget_path):
+        """Test that a delta written after the first discovery is listed without re-parsing known filenames."""
+        import shutil
+
+        budget_copy = tmp_path / test_budget_path.name
+        shutil.copytree(test_budget_path, budget_copy)
+        parser = YnabParser(budget_copy)
+
+        delta_files = parser._discover_delta_files()
+        last_end_version = parser._parse_delta_versions(delta_files[-1].name)[1]
+        new_delta = parser.device_dir / f"{last_end_version}_A-99999.ydiff"
+        new_delta.write_text('{"items": []}')
+
+        with patch.object(parser, "_parse_delta_versions", wraps=parser._parse_delta_versions) as parse_versions:
+            assert parser._discover_delta_files() == [*delta_files, new_delta]
+        parse_versions.assert_called_once_with(new_delta.name)
+
     def test_parse_delta_versions_handles_valid_filenames(self, parser):
         """Test that _parse_delta_versions correctly parses valid delta filenames."""
         start, end = parser._parse_delta_versions("A-63_A-67.ydiff")
@@ -323,6 +358,19 @@ class TestYnabParser:
         assert len(parser.payees) >= initial_payee_count
         assert len(parser.transactions) >= initial_transaction_count
 
+    def test_apply_deltas_applies_prefetched_deltas_in_version_order(self, parser):
+        """Test that deltas loaded on worker threads are still applied one by one in version order."""
+        parser.parse_up_to_version(0)
+        expected_order = parser._discover_delta_files()
+
+        with patch.object(parser, "_apply_delta", wraps=parser._apply_delta) as apply_delta:
+            parser.apply_deltas()
+
+        applied_order = [call_args[0][0] for call_args in apply_delta.call_args_list]
+        assert applied_order == expected_order
+        assert parser.applied_deltas == expected_order
+        assert all(isinstance(call_args[0][1], dict) for call_args in apply_delta.call_args_list)
+
     def test_apply_delta_handles_transaction_processing(self, parser):
         """Test that _apply_delta correctly processes transaction changes."""
         # Parse initial budget
@@ -719,6 +767,42 @@ class TestYnabParser:
         assert updated_mcb.categoryId == "EXISTING-CATEGORY"  # Should remain the same
         assert updated_mcb.overspendingHandling == "AffectsBuffer"  # Should remain the same
 
+    def test_apply_delta_update_validates_delta_fields_and_keeps_original_entity(self, parser):
+        """Test that merged delta fields are coerced and the replaced entity object is left untouched."""
+        parser.parse()
+
+        existing_mcb = MonthlyCategoryBudget(
+            entityId="MCB/2017-01/MERGE-CATEGORY",
+            categoryId="MERGE-CATEGORY",
+            budgeted=100.00,
+            parentMonthlyBudgetId="MB/2017-01",
+            entityVersion="A-10",
+        )
+        parser.monthly_category_budgets["MCB/2017-01/MERGE-CATEGORY"] = existing_mcb
+
+        mock_delta = {
+            "items": [
+                {
+                    "entityId": "MCB/2017-01/MERGE-CATEGORY",
+                    "entityType": "monthlyCategoryBudget",
+                    "isTombstone": False,
+                    "entityVersion": "A-20",
+                    "budgeted": 250,
+                }
+            ]
+        }
+
+        with patch("builtins.open", mock_open(read_data=json.dumps(mock_delta))):
+            parser._apply_delta(Path("test.ydiff"))
+
+        updated_mcb = parser.monthly_category_budgets["MCB/2017-01/MERGE-CATEGORY"]
+        assert updated_mcb is not existing_mcb
+        assert isinstance(updated_mcb.budgeted, float)
+        assert updated_mcb.budgeted == 250.0
+        assert updated_mcb.parentMonthlyBudgetId == "MB/2017-01"
+        assert existing_mcb.budgeted == 100.00
+        assert existing_mcb.entityVersion == "A-10"
+
     def test_apply_delta_handles_monthly_category_budget_tombstone_deletions(self, parser):
         """Test that _apply_delta correctly handles tombstone deletions of monthly category budgets."""
         parser.parse()
@@ -950,6 +1034,16 @@ class TestPayeeStringConditionParsing:
         assert model is not None
         assert collection is parser.payee_string_conditions
 
+    def test_get_entity_mapping_follows_collections_after_restore(self, parser):
+        """Test that the entity dispatch table points at the live collections after a version restore."""
+        parser.parse()
+        parser.restore_to_version(0)
+
+        collection, _ = parser._get_entity_mapping("transaction")
+        assert collection is parser.transactions
+        collection, _ = parser._get_entity_mapping("payeeStringCondition")
+        assert collection is parser.payee_string_conditions
+
     def test_parser_no_longer_logs_warnings_for_payee_string_condition(self, parser):
         """Test that parser no longer logs warnings for payeeStringCondition entity type."""
         with patch("ynab_io.parser.logging.warning") as mock_warning:
@@ -1188,6 +1282,15 @@ class TestYnabParserVersionTracking:
             assert isinstance(applied_delta, Path)
             assert applied_delta.suffix == ".ydiff"
 
+    def test_parser_load_applies_all_deltas_without_building_budget(self, parser, test_budget_path):
+        """Test that load() leaves the parser in the same state as parse() without returning a Budget."""
+        assert parser.load() is None
+
+        reference = YnabParser(test_budget_path)
+        reference.parse()
+        assert parser.applied_deltas == reference.applied_deltas
+        assert parser.transactions == reference.transactions
+
     def test_parser_can_restore_to_specific_delta_version(self, parser):
         """Test that parser can restore state to a specific delta version number."""
         parser.parse()  # Full parse applies all deltas
@@ -1220,6 +1323,33 @@ class TestYnabParserVersionTracking:
         # Should have the original counts from Budget.yfull (base state actually has more entities)
         assert_parser_collections_populated(parser)
 
+    def test_parser_restore_to_current_version_discards_in_place_edits(self, parser):
+        """Test that restoring to the version already applied still rebuilds that version from the base state."""
+        parser.parse_up_to_version(0)
+        transaction_id, transaction = next(iter(parser.transactions.items()))
+        original_amount = transaction.amount
+
+        transaction.amount = 999999.0
+        parser.restore_to_version(0)
+
+        assert parser.transactions[transaction_id].amount == original_amount
+
+    def test_parser_restore_is_not_affected_by_in_place_entity_edits(self, parser):
+        """Test that editing a parsed entity in place does not corrupt the saved base state."""
+        parser.parse()
+        base_transaction_id = next(iter(parser._base_state["transactions"]))
+        original_amount = parser._base_state["transactions"][base_transaction_id].amount
+
+        parser.transactions[base_transaction_id].amount = 999999.0
+        parser.restore_to_version(0)
+        assert parser.transactions[base_transaction_id].amount == original_amount
+
+        # Entities handed out by a restore are copies too, so editing them leaves the saved state intact
+        parser.transactions[base_transaction_id].amount = 999999.0
+        parser.restore_to_version(parser.get_available_versions()[-1])
+        parser.restore_to_version(0)
+        assert parser.transactions[base_transaction_id].amount == original_amount
+
     def test_parser_restore_to_version_raises_error_for_invalid_version(self, parser):
         """Test that restore_to_version raises error for version not in delta sequence."""
         parser.parse()
@@ -1254,6 +1384,18 @@ class TestYnabParserVersionTracking:
             assert account.accountName == original_account.accountName
             assert account.accountType == original_account.accountType
 
+    def test_parser_restore_is_not_affected_by_applied_deltas(self, parser):
+        """Test that applying every delta after a restore leaves the saved base snapshot untouched."""
+        parser.parse()
+        parser.restore_to_version(0)
+        base_transactions = {entity_id: txn.model_dump() for entity_id, txn in parser.transactions.items()}
+
+        parser.restore_to_version(parser.get_available_versions()[-1])
+        assert parser.applied_deltas
+
+        parser.restore_to_version(0)
+        assert {entity_id: txn.model_dump() for entity_id, txn in parser.transactions.items()} == base_transactions
+
     def test_parser_get_version_end_number_extracts_correct_version(self, parser):
         """Test that _get_version_end_number correctly extracts version numbers from delta filenames."""
         # Test with simple version format
@@ -11,6 +11,8 @@ rather than duplicating their coverage.
 
 import json
 
+import pytest
+
 from ynab_io.device_manager import DeviceManager
 
 
@@ -145,6 +147,28 @@ class TestPathDiscoveryConsistency:
         budget_file_2 = device_manager.get_budget_file_path(test_device_guid)
         assert budget_file_1 == budget_file_2
 
+    def test_resolved_directories_reset_when_budget_dir_changes(self, tmp_path):
+        """Test that memoized data/devices directories follow a reassigned budget_dir."""
+        first_budget = tmp_path / "first"
+        second_budget = tmp_path / "second"
+        (first_budget / "data1~FIRST" / "devices").mkdir(parents=True)
+        (second_budget / "data1~SECOND" / "devices").mkdir(parents=True)
+
+        device_manager = DeviceManager(budget_dir=first_budget)
+        assert device_manager.get_devices_dir_path() == first_budget / "data1~FIRST" / "devices"
+
+        device_manager.budget_dir = second_budget
+        assert device_manager.get_data_dir_path() == second_budget / "data1~SECOND"
+        assert device_manager.get_devices_dir_path() == second_budget / "data1~SECOND" / "devices"
+
+    def test_get_device_guid_missing_device_raises_file_not_found(self, tmp_path):
+        """Test that looking up an unknown short ID reports the missing .ydevice file."""
+        (tmp_path / "data1~TEST" / "devices").mkdir(parents=True)
+        device_manager = DeviceManager(budget_dir=tmp_path)
+
+        with pytest.raises(FileNotFoundError, match="Could not find .ydevice file for short_id B"):
+            device_manager.get_device_guid("B")
+
 
 class TestRequiredPathDiscoveryMethods:
     """Test that required path discovery methods exist for consolidation."""
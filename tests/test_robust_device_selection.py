@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from ynab_io.parser import YnabParser
 
 
@@ -107,3 +109,18 @@ class TestRobustDeviceSelection:
         assert parser.device_dir.name == device_c_guid, (
             f"Expected device C ({device_c_guid}) but got {parser.device_dir.name}"
         )
+
+    def test_parser_reports_non_string_knowledge_as_corrupted_data(self, tmp_path):
+        """Test that a .ydevice with non-string knowledge surfaces as corrupted budget data, not an AttributeError."""
+        budget_dir = tmp_path / "bad_knowledge_budget"
+        budget_dir.mkdir()
+        data_dir = budget_dir / "data1~BAD"
+        data_dir.mkdir()
+        devices_dir = data_dir / "devices"
+        devices_dir.mkdir()
+        (data_dir / "DEVICE-BAD").mkdir()
+        with open(devices_dir / "A.ydevice", "w") as f:
+            json.dump({"deviceGUID": "DEVICE-BAD", "shortDeviceId": "A", "knowledge": 5}, f)
+
+        with pytest.raises(ValueError, match="Corrupted YNAB4 budget data: Invalid version string '5'"):
+            YnabParser(budget_dir)
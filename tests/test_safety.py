@@ -1,5 +1,6 @@
 """Tests for backup and safety utilities."""
 
+import errno
 import shutil
 import tempfile
 import threading
@@ -9,6 +10,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from filelock import Timeout
 
 from src.ynab_io.safety import BackupManager, LockManager
 
@@ -181,14 +183,90 @@ class TestLockManager:
         assert "failed" in results
         assert len(results) == 2
 
+    def test_shared_locks_do_not_block_each_other(self):
+        """Test that two shared (reader) locks can be held at the same time."""
+        with LockManager(self.budget_dir, shared=True):
+            with LockManager(self.budget_dir, timeout=0.1, shared=True):
+                assert (self.budget_dir / "budget.lock").exists()
+
+    def test_shared_lock_waits_for_exclusive_lock(self):
+        """Test that shared and exclusive locks exclude each other in both directions."""
+        with LockManager(self.budget_dir):
+            with pytest.raises(Timeout):
+                with LockManager(self.budget_dir, timeout=0.1, shared=True):
+                    pass
+
+        with LockManager(self.budget_dir, shared=True):
+            with pytest.raises(Timeout):
+                with LockManager(self.budget_dir, timeout=0.1):
+                    pass
+
+        # Both modes are available again once released
+        with LockManager(self.budget_dir, timeout=0.1):
+            pass
+
+    def test_shared_lock_with_negative_timeout_waits_for_release(self):
+        """Test that a negative timeout makes a shared lock wait until the exclusive holder releases."""
+        exclusive_acquired = threading.Event()
+        exclusive_released = threading.Event()
+
+        def hold_exclusive_lock():
+            with LockManager(self.budget_dir):
+                exclusive_acquired.set()
+                time.sleep(0.2)
+            exclusive_released.set()
+
+        holder = threading.Thread(target=hold_exclusive_lock)
+        holder.start()
+        exclusive_acquired.wait()
+        try:
+            with LockManager(self.budget_dir, timeout=-1, shared=True):
+                assert exclusive_released.wait(timeout=1)
+        finally:
+            holder.join()
+
+    def test_shared_lock_refuses_symlinked_lock_file(self):
+        """Test that a shared lock does not follow a symlink planted at the lock file path."""
+        target = self.temp_dir / "elsewhere"
+        (self.budget_dir / "budget.lock").symlink_to(target)
+
+        with pytest.raises(Exception, match="Failed to acquire lock"):
+            with LockManager(self.budget_dir, shared=True):
+                pass
+
+        assert not target.exists()
+
+    @pytest.mark.filterwarnings("ignore:flock not supported")
+    def test_shared_lock_falls_back_to_exclusive_lock_without_flock(self):
+        """Test that file systems without flock support get the exclusive lock instead."""
+        with patch("src.ynab_io.safety.fcntl.flock", side_effect=OSError(errno.ENOSYS, "Function not implemented")):
+            with LockManager(self.budget_dir, shared=True) as lock_manager:
+                assert lock_manager.file_lock.is_locked
+
+        assert not lock_manager.file_lock.is_locked
+
     def test_lock_manager_raises_error_for_invalid_budget_path(self):
         """Test that LockManager raises error for invalid budget paths."""
         invalid_path = Path("/non/existent/path.ynab4")
 
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError) as exc_info:
             with LockManager(invalid_path):
                 pass
 
+        assert str(exc_info.value) == f"Budget path does not exist: {invalid_path}"
+
+    def test_lock_manager_treats_path_below_file_as_missing(self):
+        """Test that a budget path nested under a regular file raises FileNotFoundError for that path."""
+        regular_file = self.temp_dir / "afile"
+        regular_file.write_text("")
+        nested_path = regular_file / "sub"
+
+        with pytest.raises(FileNotFoundError) as exc_info:
+            with LockManager(nested_path):
+                pass
+
+        assert str(exc_info.value) == f"Budget path does not exist: {nested_path}"
+
     def test_lock_manager_raises_error_for_non_ynab4_directory(self):
         """Test that LockManager raises error for non-YNAB4 directories."""
         non_budget_dir = self.temp_dir / "NotABudget"
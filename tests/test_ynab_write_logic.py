@@ -67,6 +67,18 @@ class TestDeviceRegistration:
         assert "YNABVersion" in ydevice_data
         assert "deviceType" in ydevice_data
 
+    def test_create_ydevice_structure_rejects_invalid_short_id(self):
+        """Test that short IDs outside A-Z are rejected."""
+        from ynab_io.device_manager import DeviceManager
+
+        device_manager = DeviceManager()
+
+        for short_id in ("", "a", "AB", "1"):
+            with pytest.raises(ValueError, match="short_id must be a single character"):
+                device_manager.create_ydevice_structure(
+                    device_guid="TEST-GUID", short_id=short_id, friendly_name="Test Device", knowledge="A-1"
+                )
+
     def test_assign_device_short_id_sequential(self):
         """Test assigning device short IDs sequentially (A, B, C, etc.)."""
         from ynab_io.device_manager import DeviceManager
@@ -86,6 +98,18 @@ class TestDeviceRegistration:
         short_id_4 = device_manager.assign_next_short_id(existing_devices)
         assert short_id_4 == "D"
 
+    def test_assign_device_short_id_fills_gaps_and_rejects_full_set(self):
+        """Test that the lowest free letter is reused and that A-Z all taken raises ValueError."""
+        from ynab_io.device_manager import DeviceManager
+
+        device_manager = DeviceManager()
+
+        assert device_manager.assign_next_short_id(["C", "A", "D"]) == "B"
+
+        all_ids = [chr(ord("A") + i) for i in range(26)]
+        with pytest.raises(ValueError, match="Maximum device count"):
+            device_manager.assign_next_short_id(all_ids)
+
     def test_register_new_device_creates_files(self, tmp_path):
         """Test registering new device creates .ydevice file."""
         from ynab_io.device_manager import DeviceManager
@@ -265,6 +289,43 @@ class TestKnowledgeVersionTracking:
 
         assert global_knowledge is None
 
+    def test_get_global_knowledge_reflects_knowledge_updates(self, tmp_path):
+        """Test that loaded .ydevice data is refreshed after update_device_knowledge writes a device file."""
+        from ynab_io.device_manager import DeviceManager
+
+        devices_dir = tmp_path / "budget" / "data1~TEST" / "devices"
+        devices_dir.mkdir(parents=True)
+        ydevice_path = devices_dir / "A.ydevice"
+        with open(ydevice_path, "w") as f:
+            json.dump({"deviceGUID": "GUID-A", "shortDeviceId": "A", "knowledge": "A-86"}, f)
+
+        device_manager = DeviceManager(budget_dir=tmp_path / "budget")
+        assert device_manager.get_global_knowledge() == "A-86"
+
+        device_manager.update_device_knowledge(ydevice_path, "A-87")
+
+        assert device_manager.get_global_knowledge() == "A-87"
+
+    def test_get_global_knowledge_reflects_external_device_edits(self, tmp_path):
+        """Test that global knowledge is recomputed when a .ydevice file is edited on disk."""
+        from ynab_io.device_manager import DeviceManager
+
+        devices_dir = tmp_path / "budget" / "data1~TEST" / "devices"
+        devices_dir.mkdir(parents=True)
+        ydevice_path = devices_dir / "A.ydevice"
+        with open(ydevice_path, "w") as f:
+            json.dump({"deviceGUID": "GUID-A", "shortDeviceId": "A", "knowledge": "A-86"}, f)
+
+        device_manager = DeviceManager(budget_dir=tmp_path / "budget")
+        assert device_manager.get_global_knowledge() == "A-86"
+        assert device_manager.get_global_knowledge() == "A-86"
+
+        # Another application rewrites the file in place
+        with open(ydevice_path, "w") as f:
+            json.dump({"deviceGUID": "GUID-A", "shortDeviceId": "A", "knowledge": "A-90"}, f)
+
+        assert device_manager.get_global_knowledge() == "A-90"
+
 
 class TestYdiffFileGeneration:
     """Test .ydiff file generation mechanisms."""
@@ -643,10 +704,13 @@ class TestYdeviceUpdate:
             json.dump(initial_data, f)
 
         # Mock file write failure to test atomic behavior
-        with patch("builtins.open", side_effect=OSError("Disk full")):
+        with patch("ynab_io.device_manager._dump_json", side_effect=OSError("Disk full")):
             with pytest.raises(IOError):
                 device_manager.update_device_knowledge(ydevice_path=ydevice_path, new_knowledge="A-89")
 
+        # The failed update must not leave its temporary file behind
+        assert [p.name for p in tmp_path.iterdir()] == ["A.ydevice"]
+
         # Original file should remain unchanged after failed update
         with open(ydevice_path, "r") as f:
             data = json.load(f)